@@ -1,50 +1,28 @@
 import os
-import pandas as pd
+from columnar import export_adjacency
+from ingest import ingest_file
+from parallel import map_files
 
-def extract_name_column(df):
-    """
-    Detects the column that contains connection names.
-    Works even if column names vary.
-    """
-    possible_cols = ["name", "full name", "first name", "connection", "connections"]
-
-    df_cols_lower = [c.lower().strip() for c in df.columns]
-
-    # match any possible column
-    for col in possible_cols:
-        if col in df_cols_lower:
-            return df.columns[df_cols_lower.index(col)]
-
-    return df.columns[0]
-
-
-def build_adjacency(cleaned_folder, adjacency_folder):
+def build_adjacency(cleaned_folder, adjacency_folder, workers=1, dataset=None):
     """
     Converts each cleaned connection file into an adjacency list CSV
     with *one column* --> "connected_to"
+    workers > 1 parses the files on a process pool.
+    dataset reads the cleaned rows from a columnar dataset instead of
+    cleaned_folder (the adjacency CSVs are then an export of it).
     """
+    if dataset:
+        export_adjacency(dataset, adjacency_folder)
+        return
+
     if not os.path.exists(adjacency_folder):
         os.makedirs(adjacency_folder)
 
-    files = [f for f in os.listdir(cleaned_folder) if f.endswith(".csv")]
-
-    for file in files:
-        inp_path = os.path.join(cleaned_folder, file)
-        out_path = os.path.join(adjacency_folder, file)
-
-        try:
-            df = pd.read_csv(inp_path)
-
-            name_col = extract_name_column(df)
-            connections = df[name_col].dropna().unique()
-
-            out_df = pd.DataFrame({"connected_to": connections})
-            out_df.to_csv(out_path, index=False)
-
-            print(f" Created adjacency --> {file}")
+    files = sorted(f for f in os.listdir(cleaned_folder) if f.endswith(".csv"))
+    jobs = [("cleaned", os.path.join(cleaned_folder, f), os.path.join(adjacency_folder, f), None) for f in files]
 
-        except Exception as e:
-            print(f" Failed for {file}: {e}")
+    for _, _, _, message in map_files(ingest_file, jobs, workers):
+        print(message)
 
 
 if __name__ == "__main__":
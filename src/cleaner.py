@@ -1,89 +1,266 @@
+import argparse
+import codecs
 import os
+import time
 import pandas as pd
-import re
+from parallel import map_files
+from columnar import write_connections
+from naming import output_name, student_for
+
+CHUNK_ROWS = 50000
+FALLBACK_ENCODING = "ISO-8859-1"
+
+
+def sniff_encoding(file_path, block_size=1 << 20):
+    """
+    Encoding of a raw CSV, decided once before parsing: a BOM if there is
+    one, otherwise UTF-8 if the raw bytes decode as UTF-8 (checked block by
+    block, without parsing), otherwise ISO-8859-1, which accepts any bytes.
+    """
+    with open(file_path, "rb") as f:
+        head = f.read(4)
+        if head.startswith(codecs.BOM_UTF8):
+            return "utf-8-sig"
+        if head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+            return "utf-16"
+
+        f.seek(0)
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        try:
+            for block in iter(lambda: f.read(block_size), b""):
+                decoder.decode(block)
+            decoder.decode(b"", final=True)
+        except UnicodeDecodeError:
+            return FALLBACK_ENCODING
+    return "utf-8"
+
+
+def read_chunks(file_path, encoding=None, chunk_rows=CHUNK_ROWS):
+    """
+    Yields the rows of a raw export as DataFrames of at most chunk_rows
+    (all values as strings). Excel files have no streaming reader in pandas
+    and come back as a single chunk.
+    """
+    if os.path.splitext(file_path)[1] == ".csv":
+        with pd.read_csv(file_path, encoding=encoding, dtype=str, chunksize=chunk_rows) as reader:
+            yield from reader
+    else:
+        yield pd.read_excel(file_path, dtype=str)
+
+
+def normalize_chunk(df):
+    """
+    Normalizes one chunk of a raw export to Full Name / Company.
+    Returns (clean_df, message); clean_df is None when the columns have no names.
+    """
+    # --- Normalize columns ---
+    df.columns = df.columns.str.strip().str.title()
+
+    # POSSIBLE column variations
+    possible_first = ["First Name", "Firstname", "Given Name"]
+    possible_last = ["Last Name", "Lastname", "Surname"]
+    possible_full = ["Full Name", "Name"]
+
+    # Auto-detect name columns
+    first_col = next((c for c in possible_first if c in df.columns), None)
+    last_col = next((c for c in possible_last if c in df.columns), None)
+    full_col = next((c for c in possible_full if c in df.columns), None)
+
+
+    if full_col and not (first_col and last_col):
+        df["Full Name"] = df[full_col].astype(str)
+        parts = df["Full Name"].str.split(" ", n=1, expand=True)
+        df["First Name"] = parts[0]
+        df["Last Name"] = parts[1] if parts.shape[1] > 1 else ""
+        first_col, last_col = "First Name", "Last Name"
+
+    if not (first_col and last_col):
+        return None, "No name columns found."
+
+    # Company detection
+    possible_company = ["Company", "Company Name", "Organization"]
+    company_col = next((c for c in possible_company if c in df.columns), None)
+
+    if not company_col:
+        df["Company"] = "None"
+    else:
+        df["Company"] = df[company_col].fillna("None")
+
+    # Create clean format
+    df["Full Name"] = df[first_col].astype(str) + " " + df[last_col].astype(str)
+    return df[["Full Name", "Company"]], None
 
-def clean_all(input_dir, output_dir="cleaned_folder"):
-    os.makedirs(output_dir, exist_ok=True)
 
-    all_files = [
+def clean_file(job):
+    """
+    Worker job: streams one raw export through normalize_chunk and writes
+    its cleaned CSV chunk by chunk (to a temporary file renamed on success,
+    so a failed file never leaves a partial output behind).
+
+    `job` is (file_path, output_dir, csv, keep_frame, chunk_rows).
+    Returns (clean_df, out_name, message, stats): clean_df is the whole
+    cleaned frame when keep_frame is set (None otherwise, and None with a
+    message when the file is skipped); stats holds the per-file
+    throughput and error figures.
+    """
+    file_path, output_dir, csv, keep_frame, chunk_rows = job
+    out_name = output_name(file_path)
+    out_path = os.path.join(output_dir, out_name)
+    tmp_path = out_path + ".tmp"
+    stats = {"File": os.path.basename(file_path), "Output": out_name, "Encoding": None, "Rows": 0,
+             "Chunks": 0, "Bytes": os.path.getsize(file_path), "Seconds": 0.0, "Error": ""}
+    start = time.perf_counter()
+    frames = []
+
+    def failed(message):
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        stats["Error"] = message
+        stats["Seconds"] = time.perf_counter() - start
+        return None, None, f" Skipping {file_path}: {message}", stats
+
+    # --- read file safely, one chunk at a time ---
+    try:
+        if file_path.endswith(".csv"):
+            stats["Encoding"] = sniff_encoding(file_path)
+        for chunk in read_chunks(file_path, stats["Encoding"], chunk_rows):
+            clean_df, message = normalize_chunk(chunk)
+            if clean_df is None:
+                return failed(message)
+
+            if csv:
+                clean_df.to_csv(tmp_path, mode="w" if stats["Chunks"] == 0 else "a",
+                                header=stats["Chunks"] == 0, index=False)
+            if keep_frame:
+                frames.append(clean_df)
+            stats["Rows"] += len(clean_df)
+            stats["Chunks"] += 1
+    except Exception as e:
+        return failed(f"Could not read → {e}")
+
+    if stats["Chunks"] == 0:
+        return failed("No rows found.")
+    if csv:
+        os.replace(tmp_path, out_path)
+
+    stats["Seconds"] = time.perf_counter() - start
+    clean_df = pd.concat(frames, ignore_index=True) if keep_frame else None
+    return clean_df, out_name, None, stats
+
+
+def raw_files(input_dir):
+    """Sorted paths of the raw CSV/XLSX exports in input_dir."""
+    return [
         os.path.join(input_dir, f)
-        for f in os.listdir(input_dir)
+        for f in sorted(os.listdir(input_dir))
         if f.endswith(".csv") or f.endswith(".xlsx")
     ]
 
-    cleaned_paths = []
 
-    for file_path in all_files:
-        ext = os.path.splitext(file_path)[1]
+def format_stats(stats):
+    """One status line of per-file cleaning stats."""
+    seconds = max(stats["Seconds"], 1e-9)
+    return (f" {stats['File']} → {stats['Output']}: {stats['Rows']} rows in {stats['Chunks']} chunk(s), "
+            f"{stats['Rows'] / seconds:,.0f} rows/s, {stats['Bytes'] / seconds / 1e6:.1f} MB/s"
+            + (f" ({stats['Encoding']})" if stats["Encoding"] else ""))
 
-        # --- read file safely ---
-        try:
-            if ext == ".csv":
-                try:
-                    df = pd.read_csv(file_path)
-                except UnicodeDecodeError:
-                    df = pd.read_csv(file_path, encoding="ISO-8859-1")
-            else:
-                df = pd.read_excel(file_path)
-        except Exception as e:
-            print(f" Could not read: {file_path} → {e}")
-            continue
 
-        # --- Normalize columns ---
-        df.columns = df.columns.str.strip().str.title()
-
-        # POSSIBLE column variations
-        possible_first = ["First Name", "Firstname", "Given Name"]
-        possible_last = ["Last Name", "Lastname", "Surname"]
-        possible_full = ["Full Name", "Name"]
-
-        # Auto-detect name columns
-        first_col = next((c for c in possible_first if c in df.columns), None)
-        last_col = next((c for c in possible_last if c in df.columns), None)
-        full_col = next((c for c in possible_full if c in df.columns), None)
-
-    
-        if full_col and not (first_col and last_col):
-            df["Full Name"] = df[full_col].astype(str)
-            parts = df["Full Name"].str.split(" ", n=1, expand=True)
-            df["First Name"] = parts[0]
-            df["Last Name"] = parts[1] if parts.shape[1] > 1 else ""
-            first_col, last_col = "First Name", "Last Name"
-
-        if not (first_col and last_col):
-            print(f" Skipping {file_path}: No name columns found.")
+def clean_files(file_paths, output_dir="cleaned_folder", workers=1, frames=None, csv=True, stats=None,
+                chunk_rows=CHUNK_ROWS):
+    """
+    Cleans the given raw files into output_dir; every file is streamed in
+    chunks of chunk_rows and written by its worker.
+    Returns (file_path, out_path) pairs; out_path is None for skipped files.
+    If `frames` is a dict, every cleaned DataFrame is also stored there under
+    its output file name (for the columnar backend); csv=False skips the CSVs,
+    and out_path is then the file's dataset key (the output stem) instead.
+    If `stats` is a list, the per-file stats are appended to it.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+
+    jobs = [(file_path, output_dir, csv, frames is not None, chunk_rows) for file_path in file_paths]
+    results = []
+
+    for file_path, (clean_df, out_name, message, file_stats) in zip(file_paths, map_files(clean_file, jobs, workers)):
+        if stats is not None:
+            stats.append(file_stats)
+
+        if out_name is None:
+            print(message)
+            results.append((file_path, None))
             continue
 
-        # Company detection
-        possible_company = ["Company", "Company Name", "Organization"]
-        company_col = next((c for c in possible_company if c in df.columns), None)
+        print(format_stats(file_stats))
+        if frames is not None:
+            frames[out_name] = clean_df
+
+        results.append((file_path, os.path.join(output_dir, out_name) if csv else out_name[:-len(".csv")]))
 
-        if not company_col:
-            df["Company"] = "None"
-        else:
-            df["Company"] = df[company_col].fillna("None")
+    return results
 
-        # Create clean format
-        df["Full Name"] = df[first_col].astype(str) + " " + df[last_col].astype(str)
-        clean_df = df[["Full Name", "Company"]]
 
-        # Output filename
-        base = os.path.basename(file_path)
-        name_match = re.search(r"([A-Za-z]+)[ _]([A-Za-z]+)", base)
+def cleaned_rows(frames):
+    """
+    Turns {out_name: cleaned DataFrame} into columnar dataset rows
+    (source = student, target = connection, company, file = output stem).
+    """
+    parts = []
+    for out_name, df in sorted(frames.items()):
+        stem = out_name[:-len(".csv")]
+        parts.append(pd.DataFrame({
+            "source": student_for(stem),
+            "target": df["Full Name"].values,
+            # "None" is the cleaner's placeholder; CSV readers see it as missing too
+            "company": df["Company"].where(df["Company"] != "None").values,
+            "file": stem,
+        }))
+    return pd.concat(parts, ignore_index=True) if parts else pd.DataFrame(columns=["source", "target", "company", "file"])
 
-        if name_match:
-            out_name = f"{name_match.group(1)}_{name_match.group(2)}.csv"
-        else:
-            out_name = base.replace(".xlsx", ".csv")
 
-        out_path = os.path.join(output_dir, out_name)
-        clean_df.to_csv(out_path, index=False)
+def clean_all(input_dir, output_dir="cleaned_folder", workers=1, dataset=None, fmt="parquet", csv=True,
+              stats_output=None, chunk_rows=CHUNK_ROWS):
+    """
+    Cleans every raw CSV/XLSX in input_dir into output_dir.
+    workers > 1 streams the files on a process pool; every file gets its own
+    output (named by its stable ID), so runs are deterministic.
+    dataset writes the cleaned rows as a columnar Parquet/Arrow dataset;
+    csv=False then skips the per-file CSVs.
+    stats_output saves the per-file throughput and error stats as CSV.
+    Returns the cleaned CSV paths, or the dataset keys with csv=False.
+    """
+    frames = {} if dataset else None
+    stats = []
+    start = time.perf_counter()
+    results = clean_files(raw_files(input_dir), output_dir, workers, frames, csv, stats, chunk_rows)
+    cleaned_paths = [out_path for _, out_path in results if out_path]
 
-        cleaned_paths.append(out_path)
+    if dataset:
+        write_connections(cleaned_rows(frames), dataset, fmt)
 
-    print(f"\n Cleaned {len(cleaned_paths)} files successfully.")
+    if stats_output:
+        pd.DataFrame(stats).to_csv(stats_output, index=False)
+        print(f" Cleaning stats saved → {stats_output}")
+
+    elapsed = time.perf_counter() - start
+    rows = sum(s["Rows"] for s in stats)
+    print(f"\n Cleaned {len(cleaned_paths)} files successfully ({len(results) - len(cleaned_paths)} failed, "
+          f"{rows} rows in {elapsed:.1f}s).")
     return cleaned_paths
 
 
 if __name__ == "__main__":
-    clean_all(r"C:\Users\INDIAN  OIL\Downloads\LinkedIn Data Public\LinkedIn Data Public")
+    parser = argparse.ArgumentParser(description="Clean the raw LinkedIn exports.")
+    parser.add_argument("input_dir", nargs="?",
+                        default=r"C:\Users\INDIAN  OIL\Downloads\LinkedIn Data Public\LinkedIn Data Public")
+    parser.add_argument("--output", default="cleaned_folder")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--dataset", help="also write the cleaned rows as a columnar dataset in this folder")
+    parser.add_argument("--format", choices=["parquet", "ipc"], default="parquet")
+    parser.add_argument("--no-csv", action="store_true", help="with --dataset, skip the per-file CSVs")
+    parser.add_argument("--stats", default="data/clean_stats.csv")
+    args = parser.parse_args()
+
+    if args.no_csv and not args.dataset:
+        parser.error("--no-csv needs --dataset")
+    clean_all(args.input_dir, args.output, args.workers, args.dataset, args.format, not args.no_csv,
+              args.stats)
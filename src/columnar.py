@@ -0,0 +1,142 @@
+import os
+import shutil
+import zlib
+import pandas as pd
+from ingest import connection_edges, ingest_file
+from naming import student_for
+from parallel import map_files
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+except ImportError:  # optional: only needed for the columnar backend
+    pa = None
+    ds = None
+
+COLUMNS = ["source", "target", "company", "file"]
+DICTIONARY_COLUMNS = ["source", "target", "company", "file"]
+PARTITIONS = 16
+
+
+def require_arrow():
+    if pa is None:
+        raise ImportError("The columnar dataset backend needs pyarrow: pip install pyarrow")
+
+
+def dataset_format(dataset_dir):
+    """'ipc' when the dataset was written as Arrow IPC files, 'parquet' otherwise."""
+    for root, _, files in os.walk(dataset_dir):
+        for f in files:
+            if f.endswith(".arrow"):
+                return "ipc"
+    return "parquet"
+
+
+def _bucket(source):
+    return zlib.crc32(str(source).encode("utf-8")) % PARTITIONS
+
+
+def to_table(df):
+    """
+    Converts a source/target/company/file DataFrame to an Arrow table with
+    dictionary-encoded string columns and a stable `part` bucket per source.
+    """
+    require_arrow()
+    df = df.reindex(columns=COLUMNS)
+    df["part"] = df["source"].map(_bucket).astype("int16")
+    for col in DICTIONARY_COLUMNS:
+        df[col] = df[col].astype("string").astype("category")
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+
+def write_connections(df, dataset_dir="data/network", fmt="parquet"):
+    """
+    Writes the connection rows as a dataset partitioned by `part`,
+    replacing any previous dataset at dataset_dir.
+    """
+    require_arrow()
+    if os.path.exists(dataset_dir):
+        shutil.rmtree(dataset_dir)
+
+    ds.write_dataset(
+        to_table(df),
+        dataset_dir,
+        format=fmt,
+        partitioning=ds.partitioning(pa.schema([("part", pa.int16())]), flavor="hive"),
+        basename_template="part-{i}." + ("arrow" if fmt == "ipc" else "parquet"),
+    )
+
+    print(f" Columnar dataset saved → {dataset_dir}")
+
+
+def read_connections(dataset_dir="data/network", columns=None, sources=None):
+    """
+    Reads the dataset back as a DataFrame (categorical string columns).
+    `sources` restricts the read to those students; only their partitions are touched.
+    """
+    require_arrow()
+    dataset = ds.dataset(dataset_dir, format=dataset_format(dataset_dir), partitioning="hive")
+
+    flt = None
+    if sources is not None:
+        sources = [str(s) for s in sources]
+        parts = sorted({_bucket(s) for s in sources})
+        flt = ds.field("part").isin(parts) & ds.field("source").isin(sources)
+
+    cols = [c for c in (columns or COLUMNS)]
+    df = dataset.to_table(columns=cols, filter=flt).to_pandas()
+    for col in cols:
+        if col in DICTIONARY_COLUMNS and df[col].dtype != "category":
+            df[col] = df[col].astype("category")
+    return df
+
+
+# --- import from / export to the CSV layout ---
+
+def _adjacency_rows(path):
+    """Reads one adjacency CSV (via ingest.ingest_file) into dataset rows; returns (rows, error)."""
+    student, connections, _, message = ingest_file(("adjacency", path, None, None))
+    if connections is None:
+        return None, message
+    edges = connection_edges(student, connections)
+    rows = pd.DataFrame({
+        "source": student,
+        "target": [target for _, target in edges],
+        "company": None,
+        "file": os.path.basename(path)[:-len(".csv")],
+    })
+    return rows, None
+
+
+def import_adjacency(adjacency_folder="data/adjacency", dataset_dir="data/network", fmt="parquet", workers=1):
+    """
+    Consolidates the per-person adjacency CSVs into one columnar dataset.
+    """
+    files = sorted(f for f in os.listdir(adjacency_folder) if f.endswith(".csv"))
+    paths = [os.path.join(adjacency_folder, f) for f in files]
+
+    frames = []
+    for rows, error in map_files(_adjacency_rows, paths, workers):
+        if error:
+            print(error)
+        else:
+            frames.append(rows)
+
+    df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=COLUMNS)
+    write_connections(df, dataset_dir, fmt)
+    return df
+
+
+def export_adjacency(dataset_dir="data/network", adjacency_folder="data/adjacency"):
+    """
+    Optional export back to the one-CSV-per-person adjacency layout.
+    """
+    os.makedirs(adjacency_folder, exist_ok=True)
+    df = read_connections(dataset_dir, columns=["target", "file"])
+
+    for file, group in df.groupby("file", observed=True, sort=True):
+        connections = group["target"].dropna().astype(str).unique()
+        pd.DataFrame({"connected_to": connections}).to_csv(
+            os.path.join(adjacency_folder, f"{file}.csv"), index=False)
+
+    print(f" Adjacency CSVs exported → {adjacency_folder}")
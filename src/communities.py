@@ -0,0 +1,233 @@
+import argparse
+import os
+import numpy as np
+import pandas as pd
+from graph_store import get_graph_store
+
+
+def weighted_graph(store):
+    """
+    Undirected weighted edge arrays (src, dst, weight) from the symmetric view;
+    every connection appears in both directions with weight 1.
+    """
+    offsets, neighbors = store.symmetric()
+    n = store.number_of_nodes()
+    src = np.repeat(np.arange(n, dtype=np.int64), np.diff(offsets))
+    dst = np.asarray(neighbors, dtype=np.int64)
+    return n, src, dst, np.ones(len(dst))
+
+
+def modularity(n, src, dst, weight, labels):
+    """Newman modularity of `labels` on the (both-direction) weighted edge arrays."""
+    m2 = weight.sum()
+    if m2 == 0:
+        return 0.0
+    strength = np.bincount(src, weights=weight, minlength=n)
+    inside = weight[labels[src] == labels[dst]].sum()
+    totals = np.bincount(labels, weights=strength)
+    return inside / m2 - np.square(totals / m2).sum()
+
+
+def local_moving(n, src, dst, weight, rng, max_rounds=50, tol=1e-7):
+    """
+    Louvain local-moving phase, vectorised.
+
+    Every round computes, for all nodes at once, the modularity gain of
+    moving to each neighbouring community (edge weights grouped by
+    (node, community) with one sort), then moves a random half of the nodes
+    that can improve. A round that lowers modularity is undone and the
+    move fraction is halved, which avoids the swap oscillation of fully
+    synchronous updates. Returns the labels (0..n-1).
+    """
+    labels = np.arange(n, dtype=np.int64)
+    m2 = weight.sum()
+    if m2 == 0:
+        return labels
+
+    strength = np.bincount(src, weights=weight, minlength=n)
+    not_loop = src != dst
+    s, d, w = src[not_loop], dst[not_loop], weight[not_loop]
+
+    best_q = modularity(n, src, dst, weight, labels)
+    fraction = 0.5
+
+    for _ in range(max_rounds):
+        totals = np.bincount(labels, weights=strength, minlength=n)
+
+        # weight from each node to each neighbouring community
+        keys = s * n + labels[d]
+        keys, inverse = np.unique(keys, return_inverse=True)
+        w_to = np.bincount(inverse, weights=w)
+        node, comm = keys // n, keys % n
+
+        own = labels[node] == comm
+        k = strength[node]
+        gain = w_to - k * (totals[comm] - np.where(own, k, 0.0)) / m2
+
+        stay = -strength * (totals[labels] - strength) / m2
+        np.maximum.at(stay, node[own], gain[own])
+
+        # best community per node: sort by node, then gain descending
+        order = np.lexsort((-gain, node))
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = node[order][1:] != node[order][:-1]
+        best = order[first]
+        improves = (gain[best] > stay[node[best]] + 1e-12) & ~own[best]
+        movers, targets = node[best][improves], comm[best][improves]
+
+        if not len(movers):
+            break
+
+        pick = rng.random(len(movers)) < fraction
+        trial = labels.copy()
+        trial[movers[pick]] = targets[pick]
+        q = modularity(n, src, dst, weight, trial)
+
+        if q > best_q + tol:
+            labels, best_q = trial, q
+        else:
+            fraction /= 2
+            if fraction < 0.01:
+                break
+
+    return labels
+
+
+def aggregate(n, src, dst, weight, labels):
+    """
+    Collapses communities into nodes; parallel edges are summed with one
+    bincount and internal edges become self-loops.
+    Returns (count, src, dst, weight, relabelled labels).
+    """
+    uniq, labels = np.unique(labels, return_inverse=True)
+    c = len(uniq)
+    keys = labels[src] * c + labels[dst]
+    keys, inverse = np.unique(keys, return_inverse=True)
+    w = np.bincount(inverse, weights=weight)
+    return c, keys // c, keys % c, w, labels
+
+
+def louvain(store, seed=0, max_levels=10):
+    """
+    Louvain community detection on the integer-indexed undirected graph:
+    vectorised local moving followed by array-based aggregation, repeated
+    until no level merges anything. Returns (labels, modularity).
+    """
+    rng = np.random.default_rng(seed)
+    n, src, dst, weight = weighted_graph(store)
+    membership = np.arange(n, dtype=np.int64)
+
+    count = n
+    for _ in range(max_levels):
+        labels = local_moving(count, src, dst, weight, rng)
+        new_count, src, dst, weight, labels = aggregate(count, src, dst, weight, labels)
+        membership = labels[membership]
+        if new_count == count:
+            break
+        count = new_count
+
+    n, src, dst, weight = weighted_graph(store)
+    return membership, modularity(n, src, dst, weight, membership)
+
+
+def label_propagation(store, seed=0, max_rounds=100):
+    """
+    Fast mode: semi-synchronous label propagation. A random half of the
+    nodes adopts its most frequent neighbour label each round (ties broken
+    randomly) until labels stop changing. Returns (labels, modularity).
+    """
+    rng = np.random.default_rng(seed)
+    n, src, dst, weight = weighted_graph(store)
+    nodes = np.arange(n, dtype=np.int64)
+    labels = nodes.copy()
+
+    for _ in range(max_rounds):
+        # every node also counts its own label once, which damps flooding through hubs
+        keys, counts = np.unique(np.concatenate([src * n + labels[dst], nodes * n + labels]),
+                                 return_counts=True)
+        node, label = keys // n, keys % n
+        noise = rng.random(len(keys))
+        order = np.lexsort((noise, -counts, node))
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = node[order][1:] != node[order][:-1]
+        best_node, best_label = node[order][first], label[order][first]
+
+        update = rng.random(len(best_node)) < 0.5
+        changed = best_label[update] != labels[best_node[update]]
+        if not changed.any() and np.array_equal(best_label, labels[best_node]):
+            break
+        labels[best_node[update]] = best_label[update]
+
+    labels = np.unique(labels, return_inverse=True)[1]
+    return labels, modularity(n, src, dst, weight, labels)
+
+
+def person_companies(cleaned_folder="data/cleaned"):
+    """Most common Company per person name across the cleaned files."""
+    frames = []
+    for file in sorted(os.listdir(cleaned_folder)):
+        if file.endswith(".csv"):
+            df = pd.read_csv(os.path.join(cleaned_folder, file), usecols=["Full Name", "Company"])
+            frames.append(df.dropna())
+    if not frames:
+        return pd.Series(dtype=object)
+
+    df = pd.concat(frames, ignore_index=True)
+    df["Full Name"] = df["Full Name"].astype(str).str.strip()
+    counts = df.value_counts(["Full Name", "Company"], sort=True)
+    top = counts.reset_index().drop_duplicates(subset=["Full Name"])
+    return top.set_index("Full Name")["Company"]
+
+
+def detect_communities(edge_file="data/edges.csv", cleaned_folder="data/cleaned",
+                       output="data/communities.csv", summary_output="data/community_summary.csv",
+                       companies_output="data/community_companies.csv",
+                       method="louvain", seed=0, top_companies=10):
+    """
+    Runs community detection (method "louvain", or "lpa" for the fast label
+    propagation mode) and writes:
+      communities.csv          Student, Community
+      community_summary.csv    Community, Size, Top Company
+      community_companies.csv  Community, Company, Count (top companies per community)
+    """
+    store = get_graph_store(edge_file)
+    if method == "lpa":
+        labels, q = label_propagation(store, seed)
+    else:
+        labels, q = louvain(store, seed)
+
+    # number communities by size, largest first
+    sizes = np.bincount(labels)
+    rank = np.empty_like(sizes)
+    rank[np.argsort(-sizes, kind="stable")] = np.arange(len(sizes))
+    labels = rank[labels]
+
+    members = pd.DataFrame({
+        "Student": [store.name(i) for i in range(store.number_of_nodes())],
+        "Community": labels,
+    })
+    members.sort_values(by=["Community", "Student"]).to_csv(output, index=False)
+
+    companies = members.assign(Company=members["Student"].map(person_companies(cleaned_folder)))
+    counts = (companies.dropna(subset=["Company"])
+              .groupby(["Community", "Company"]).size().rename("Count").reset_index()
+              .sort_values(by=["Community", "Count"], ascending=[True, False], kind="stable"))
+    counts.groupby("Community").head(top_companies).to_csv(companies_output, index=False)
+
+    summary = members.groupby("Community").size().rename("Size").reset_index()
+    top = counts.drop_duplicates(subset=["Community"]).set_index("Community")["Company"]
+    summary["Top Company"] = summary["Community"].map(top)
+    summary.to_csv(summary_output, index=False)
+
+    print(f" {method}: {len(summary)} communities, modularity {q:.4f}")
+    print(f" Communities saved → {output}, {summary_output}, {companies_output}")
+    return members, q
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Community detection on the connection graph.")
+    parser.add_argument("--method", choices=["louvain", "lpa"], default="louvain")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    detect_communities(method=args.method, seed=args.seed)
@@ -0,0 +1,108 @@
+import os
+import numpy as np
+import pandas as pd
+from columnar import read_connections
+from name_index import normalize
+from naming import student_for
+
+TABLE_COLUMNS = ["Student", "Company", "Key", "Count"]
+
+
+def company_table(parts):
+    """
+    Builds the company aggregate table from (student, counts) parts, where
+    counts is a Series of rows per company (NaN = no company).
+    One row per (student, company) with the normalised company key, so case
+    and punctuation variants of a company share a key.
+    """
+    frames = [pd.DataFrame({"Student": student, "Company": counts.index.astype(object), "Count": counts.values})
+              for student, counts in parts if len(counts)]
+    if not frames:
+        return pd.DataFrame(columns=TABLE_COLUMNS)
+
+    table = pd.concat(frames, ignore_index=True)
+    blank = table["Company"].map(lambda c: isinstance(c, str) and not c.strip())
+    table.loc[blank, "Company"] = np.nan
+    table = table.groupby(["Student", "Company"], dropna=False, sort=False)["Count"].sum().reset_index()
+
+    # names with no letters or digits (e.g. "—") keep their own spelling as key
+    keys = {company: normalize(company) or str(company).strip() for company in pd.unique(table["Company"].dropna())}
+    table["Key"] = table["Company"].map(keys)
+    table["Count"] = table["Count"].astype("int64")
+    return table[TABLE_COLUMNS].sort_values(by=["Student", "Count"], ascending=[True, False], kind="stable")
+
+
+def save_company_table(table, table_output="data/company_table.csv"):
+    """Writes the table; a missing company is kept as an empty Company/Key."""
+    table.to_csv(table_output, index=False)
+    print(f" Company table saved → {table_output} ({table['Key'].nunique()} companies)")
+
+
+def scan_company_table(cleaned_folder="data/cleaned"):
+    """Builds the table straight from the cleaned files (Company column only, one value_counts)."""
+    frames = []
+    for file in sorted(os.listdir(cleaned_folder)):
+        if file.endswith(".csv"):
+            df = pd.read_csv(os.path.join(cleaned_folder, file), usecols=lambda c: c == "Company")
+            if "Company" in df.columns:
+                frames.append(df.assign(Student=student_for(file)))
+
+    if not frames:
+        return pd.DataFrame(columns=TABLE_COLUMNS)
+    counts = pd.concat(frames, ignore_index=True).value_counts(["Student", "Company"], dropna=False, sort=False)
+    return company_table([(student, group.droplevel(0)) for student, group in counts.groupby(level=0, sort=False)])
+
+
+def dataset_company_table(dataset):
+    """Builds the table from the company column of a columnar dataset."""
+    df = read_connections(dataset, columns=["file", "company"])
+    counts = df.astype(object).value_counts(["file", "company"], dropna=False, sort=False)
+    return company_table([(student_for(str(file)), group.droplevel(0))
+                          for file, group in counts.groupby(level=0, sort=False)])
+
+
+def load_company_table(table_file="data/company_table.csv", cleaned_folder="data/cleaned", dataset=None):
+    """
+    The materialized company table: from the columnar dataset when given,
+    otherwise from table_file, which is built (and saved) from the cleaned
+    files when it does not exist yet.
+    """
+    if dataset:
+        return dataset_company_table(dataset)
+
+    if table_file and os.path.exists(table_file):
+        table = pd.read_csv(table_file, dtype={"Student": str, "Company": str, "Key": str}, keep_default_na=False)
+        table[["Company", "Key"]] = table[["Company", "Key"]].replace("", np.nan)
+        return table
+
+    table = scan_company_table(cleaned_folder)
+    if table_file:
+        save_company_table(table, table_file)
+    return table
+
+
+def company_counts(table, student=None, top_n=None):
+    """
+    Rows per company from the table, merged over normalised keys and
+    labelled with the most common spelling, largest first.
+    `student` keeps only that student's connections (matched on the
+    normalised name); `top_n` keeps the largest companies. Rows without a
+    company are counted under NaN (dropped by top_n).
+    """
+    if student is not None:
+        table = table[table["Student"].map(normalize) == normalize(student)]
+
+    known = table.dropna(subset=["Key"])
+    totals = known.groupby("Key")["Count"].sum()
+    labels = (known.sort_values(by="Count", ascending=False, kind="stable")
+              .drop_duplicates(subset=["Key"]).set_index("Key")["Company"])
+    counts = pd.Series(totals.values, index=labels.reindex(totals.index).values, dtype="int64")
+    counts = counts.sort_values(ascending=False, kind="stable")
+
+    if top_n is not None:
+        return counts.head(top_n)
+
+    missing = int(table.loc[table["Key"].isna(), "Count"].sum())
+    if missing:
+        counts = pd.concat([counts, pd.Series([missing], index=[np.nan], dtype="int64")])
+    return counts
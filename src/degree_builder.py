@@ -1,61 +1,62 @@
 import os
 import pandas as pd
+from columnar import export_adjacency, read_connections
+from ingest import ingest_file
+from naming import student_for
+from parallel import map_files
 
-def find_connection_column(df):
+def save_degrees(degree_data, degree_output="data/degree.csv"):
     """
-    Detects the correct connection column name in any file.
+    Writes (student, degree) rows to degree.csv, highest degree first.
     """
-    possible_cols = ["connected_to", "Connected To", "Connected_to", "connected to"]
+    degree_df = pd.DataFrame(degree_data, columns=["Student", "Degree"])
+    degree_df = degree_df.sort_values(by="Degree", ascending=False)
+    degree_df = degree_df.drop_duplicates(subset=["Student"], keep="first")
 
-    for col in df.columns:
-        if col.strip().lower().replace(" ", "_") == "connected_to":
-            return col
+    degree_df.to_csv(degree_output, index=False)
 
-    # fallback: first column
-    return df.columns[0]
+    print(f"\n Degree file saved → {degree_output}")
+
+
+def dataset_degrees(dataset):
+    """
+    Degree rows straight from a columnar dataset: unique connections per file.
+    """
+    df = read_connections(dataset, columns=["target", "file"])
+    counts = df.dropna(subset=["target"]).groupby("file", observed=True)["target"].nunique()
+    return [(student_for(str(file)), int(n)) for file, n in counts.items()]
 
 
 def build_degrees(adjacency_folder="data/adjacency",
                   degree_output="data/degree.csv",
-                  connections_output="data/connected_to"):
-    
+                  connections_output="data/connected_to",
+                  workers=1,
+                  dataset=None):
+    """
+    Counts the connections of every adjacency file into degree.csv and saves
+    a connected_to copy of each list. With `dataset` the degrees come from
+    the columnar dataset in one groupby, and connected_to is an export of it
+    (pass connections_output=None to skip the export).
+    """
+    if dataset:
+        save_degrees(dataset_degrees(dataset), degree_output)
+        if connections_output:
+            export_adjacency(dataset, connections_output)
+        return
+
     os.makedirs(connections_output, exist_ok=True)
     degree_data = []
 
-    for file in os.listdir(adjacency_folder):
-        if not file.endswith(".csv"):
-            continue
-
-        student_name = file.replace(".csv", "").replace("_", " ").strip()
-        path = os.path.join(adjacency_folder, file)
+    files = sorted(f for f in os.listdir(adjacency_folder) if f.endswith(".csv"))
+    jobs = [("adjacency", os.path.join(adjacency_folder, f), None, os.path.join(connections_output, f)) for f in files]
 
-        try:
-            df = pd.read_csv(path)
-
-            conn_col = find_connection_column(df)  # auto-detect column
-
-            connections = df[conn_col].dropna().unique()
-            degree = len(connections)
-
-            # save individual connections list
-            individual_out = os.path.join(connections_output, file)
-            pd.DataFrame({"connected_to": connections}).to_csv(individual_out, index=False)
-
-            degree_data.append((student_name, degree))
-
-            print(f" {student_name}: {degree} connections")
-
-        except Exception as e:
-            print(f" Error in {file}: {e}")
+    for student_name, connections, _, message in map_files(ingest_file, jobs, workers):
+        if connections is not None:
+            degree_data.append((student_name, len(connections)))
+        print(message)
 
     # create degree file
-    degree_df = pd.DataFrame(degree_data, columns=["Student", "Degree"])
-    degree_df = degree_df.sort_values(by="Degree", ascending=False)
-    degree_df = degree_df.drop_duplicates(subset=["Student"], keep="first")
-
-    degree_df.to_csv(degree_output, index=False)
-
-    print(f"\n Degree file saved → {degree_output}")
+    save_degrees(degree_data, degree_output)
     print(f" Connected lists saved → {connections_output}")
 
 
@@ -0,0 +1,91 @@
+import os
+import pandas as pd
+
+# rough in-memory cost of one (source, target) pair, as Python tuple and as DataFrame row
+TUPLE_BYTES = 200
+ROW_BYTES = 160
+
+HASH_KEYS = ["edgespill0000000", "edgespill1111111", "edgespill2222222", "edgespill3333333"]
+
+
+class EdgeSpiller:
+    """
+    Memory-bounded edge collector with external dedupe.
+
+    Edges are buffered up to a quarter of the memory cap, then appended to
+    hash-partitioned spill files on disk. Equal edges always land in the same
+    partition, so each partition can be deduped on its own; partitions that
+    are still too big are split again with a different hash key.
+    """
+
+    def __init__(self, spill_dir, memory_limit_mb=512, partitions=64):
+        self.spill_dir = spill_dir
+        self.memory_limit = memory_limit_mb * 2 ** 20
+        self.partitions = partitions
+        self.buffer_rows = max(1000, self.memory_limit // 4 // TUPLE_BYTES)
+        self.buffer = []
+        self.names = set()
+        os.makedirs(spill_dir, exist_ok=True)
+
+    def add(self, edges):
+        self.buffer.extend(edges)
+        if len(self.buffer) >= self.buffer_rows:
+            self.flush()
+
+    def flush(self):
+        if self.buffer:
+            df = pd.DataFrame(self.buffer, columns=["Source", "Target"])
+            self._spill(df, self.spill_dir, depth=0)
+            self.buffer = []
+
+    def _spill(self, df, folder, depth):
+        hashes = pd.util.hash_pandas_object(df, index=False, hash_key=HASH_KEYS[depth])
+        part = (hashes % self.partitions).to_numpy()
+        for p, chunk in df.groupby(part, sort=False):
+            chunk.to_csv(os.path.join(folder, f"part_{depth}_{p:04d}.csv"),
+                         mode="a", header=False, index=False)
+
+    def _dedupe(self, path, depth, out):
+        """Dedupes one spill file into `out`; returns the number of rows written."""
+        too_big = os.path.getsize(path) * ROW_BYTES // 30 > self.memory_limit
+        if too_big and depth + 1 < len(HASH_KEYS):
+            sub_dir = path + ".split"
+            os.makedirs(sub_dir, exist_ok=True)
+            for chunk in pd.read_csv(path, header=None, names=["Source", "Target"], dtype=str,
+                                     keep_default_na=False, chunksize=self.buffer_rows):
+                self._spill(chunk, sub_dir, depth + 1)
+            os.remove(path)
+            return sum(self._dedupe(os.path.join(sub_dir, f), depth + 1, out)
+                       for f in sorted(os.listdir(sub_dir)))
+
+        df = pd.read_csv(path, header=None, names=["Source", "Target"], dtype=str, keep_default_na=False)
+        df = df.drop_duplicates()
+        df.to_csv(out, header=False, index=False)
+        self.names.update(df["Source"])
+        self.names.update(df["Target"])
+        os.remove(path)
+        return len(df)
+
+    def write_deduped(self, output_edges):
+        """
+        Flushes the buffer and writes every unique edge to output_edges.
+        Returns the number of unique edges; the distinct node names are
+        left in self.names.
+        """
+        self.flush()
+        total = 0
+
+        with open(output_edges, "w", encoding="utf-8-sig", newline="") as out:
+            out.write("Source,Target\n")
+            for f in sorted(os.listdir(self.spill_dir)):
+                if f.startswith("part_0_"):
+                    total += self._dedupe(os.path.join(self.spill_dir, f), 0, out)
+
+        return total
+
+
+def edge_chunks(edge_file, chunk_rows):
+    """Reads a Source,Target edge list in chunks of (sources, targets) string arrays."""
+    for chunk in pd.read_csv(edge_file, dtype=str, keep_default_na=False, chunksize=chunk_rows,
+                             encoding="utf-8-sig"):
+        yield chunk["Source"].to_numpy(), chunk["Target"].to_numpy()
@@ -1,48 +1,133 @@
+import argparse
 import os
+import tempfile
 import pandas as pd
+from edge_stream import EdgeSpiller, edge_chunks
+from graph_store import GraphStore, default_snapshot_dir, write_snapshot
+from ingest import connection_edges, ingest_file
+from parallel import map_files
+from columnar import read_connections
 
-def build_graph(adjacency_folder="data/adjacency", output_edges="data/edges.csv"):
+
+def edges_for_file(file_path):
+    """
+    Reads one adjacency file (via ingest.ingest_file) and returns (edges, error);
+    edges are (student, connection) pairs.
+    """
+    student, connections, _, message = ingest_file(("adjacency", file_path, None, None))
+    if connections is None:
+        return [], message
+    return connection_edges(student, connections), None
+
+
+def save_edges(edges, output_edges="data/edges.csv", snapshot_dir=None):
+    """
+    Dedupes the edge pairs (a list of tuples or a Source/Target DataFrame),
+    writes edges.csv and refreshes the binary snapshot.
+    """
+    if isinstance(edges, pd.DataFrame):
+        edges_df = edges[["Source", "Target"]].copy()
+    else:
+        edges_df = pd.DataFrame(edges, columns=["Source", "Target"])
+    edges_df.drop_duplicates(inplace=True)
+
+    # save
+    edges_df.to_csv(output_edges, index=False, encoding="utf-8-sig")
+
+    print(f" edges.csv created --> {output_edges}")
+    print(f"Total edges: {len(edges_df)}")
+
+    if snapshot_dir is None:
+        snapshot_dir = default_snapshot_dir(output_edges)
+    store = GraphStore.from_edges(edges_df["Source"], edges_df["Target"])
+    write_snapshot(store, snapshot_dir, output_edges)
+
+
+def dataset_edges(dataset):
+    """
+    Unique (student, connection) edges straight from a columnar dataset.
+    """
+    df = read_connections(dataset, columns=["source", "target"]).dropna()
+    edges = pd.DataFrame({
+        "Source": df["source"].astype(str).str.strip(),
+        "Target": df["target"].astype(str).str.strip(),
+    })
+    return edges[edges["Target"] != ""]
+
+
+def build_graph(adjacency_folder="data/adjacency", output_edges="data/edges.csv", snapshot_dir=None, workers=1,
+                memory_limit_mb=None, dataset=None):
     """
     EXACT logic from your assignment.ipynb:
     For each student file:
         - read connected_to list
         - create edges: (student, connection)
-    Save all edges in edges.csv
+    Save all edges in edges.csv, plus a binary graph snapshot
+    (default: graph_snapshot/<edges stem>/ next to edges.csv) for fast loading.
+    workers > 1 parses the adjacency files on a process pool.
+    memory_limit_mb switches to streaming mode: edges are spilled to
+    hash-partitioned temp files and deduped partition by partition, so peak
+    memory stays around the cap instead of growing with the edge count.
+    dataset reads the edges from a columnar dataset instead of adjacency_folder.
     """
+    if dataset:
+        save_edges(dataset_edges(dataset), output_edges, snapshot_dir)
+        return
 
-    edges = []
 
-    for file in os.listdir(adjacency_folder):
-        if file.endswith(".csv"):
+    files = sorted(f for f in os.listdir(adjacency_folder) if f.endswith(".csv"))
+    paths = [os.path.join(adjacency_folder, f) for f in files]
 
-            student = file.replace(".csv", "").replace("_", " ").strip()
-            file_path = os.path.join(adjacency_folder, file)
+    if memory_limit_mb:
+        stream_graph(paths, output_edges, snapshot_dir, workers, memory_limit_mb)
+        return
+
+    edges = []
 
-            try:
-                df = pd.read_csv(file_path)
+    for file_edges, error in map_files(edges_for_file, paths, workers):
+        if error:
+            print(error)
+        edges.extend(file_edges)
 
-                # detect the name column (in your notebook it was always first column)
-                col = df.columns[0]
+    save_edges(edges, output_edges, snapshot_dir)
 
-                # build edges
-                for conn in df[col].dropna():
-                    conn = str(conn).strip()
-                    if conn:
-                        edges.append((student, conn))
 
-            except Exception as e:
-                print(f" Error reading {file}: {e}")
+def stream_graph(paths, output_edges, snapshot_dir=None, workers=1, memory_limit_mb=512):
+    """
+    Streaming variant of build_graph with external (spill-file) dedupe.
+    The snapshot is built from the deduped edges chunk by chunk (names are
+    collected while the partitions are deduped), so edges.csv is never read
+    into one DataFrame.
+    """
+    spill_root = os.path.dirname(output_edges) or "."
 
+    with tempfile.TemporaryDirectory(prefix="edge_spill_", dir=spill_root) as spill_dir:
+        spiller = EdgeSpiller(spill_dir, memory_limit_mb)
 
-    edges_df = pd.DataFrame(edges, columns=["Source", "Target"])
-    edges_df.drop_duplicates(inplace=True)
+        for file_edges, error in map_files(edges_for_file, paths, workers):
+            if error:
+                print(error)
+            spiller.add(file_edges)
 
-    # save
-    edges_df.to_csv(output_edges, index=False, encoding="utf-8-sig")
+        total = spiller.write_deduped(output_edges)
 
     print(f" edges.csv created --> {output_edges}")
-    print(f"Total edges: {len(edges_df)}")
+    print(f"Total edges: {total}")
+
+    if snapshot_dir is None:
+        snapshot_dir = default_snapshot_dir(output_edges)
+    chunks = edge_chunks(output_edges, spiller.buffer_rows)
+    store = GraphStore.from_edge_chunks(spiller.names, chunks, total)
+    write_snapshot(store, snapshot_dir, output_edges)
 
 
 if __name__ == "__main__":
-    build_graph()
+    parser = argparse.ArgumentParser(description="Build edges.csv and the graph snapshot from the adjacency files.")
+    parser.add_argument("--adjacency", default="data/adjacency")
+    parser.add_argument("--edges", default="data/edges.csv")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--memory-limit-mb", type=int,
+                        help="stream the edges through spill files to keep memory near this cap")
+    args = parser.parse_args()
+
+    build_graph(args.adjacency, args.edges, workers=args.workers, memory_limit_mb=args.memory_limit_mb)
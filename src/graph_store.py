@@ -0,0 +1,676 @@
+import bisect
+import json
+import os
+from array import array
+import shutil
+import tempfile
+import time
+from collections import namedtuple
+import numpy as np
+import pandas as pd
+
+SNAPSHOT_VERSION = 3
+SNAPSHOT_ARRAYS = ["names_blob", "names_offsets", "offsets", "neighbors", "rev_offsets", "rev_neighbors",
+                   "wcc", "scc"]
+
+
+PathResult = namedtuple("PathResult", ["path", "expanded", "seconds"])
+
+
+class NodeNotFound(LookupError):
+    """Raised when a name is not a node of the graph store; may carry "did you mean" suggestions."""
+
+    def __init__(self, message, suggestions=()):
+        super().__init__(message)
+        self.suggestions = list(suggestions)
+
+
+def edge_columns(df):
+    """
+    Detects the (source, target) columns of an edge list.
+    Accepts Source/Target, A/B, or falls back to the first two columns.
+    """
+    if "Source" in df.columns and "Target" in df.columns:
+        return "Source", "Target"
+    if "A" in df.columns and "B" in df.columns:
+        return "A", "B"
+    if len(df.columns) >= 2:
+        return df.columns[0], df.columns[1]
+    raise ValueError("Unknown edge columns in edges.csv")
+
+
+def build_csr(keys, values, num_nodes):
+    """
+    Groups `values` by `keys` into CSR form (offsets + flat values).
+    Values inside every row are sorted, which keeps lookups deterministic.
+    """
+    order = np.lexsort((values, keys))
+    flat = values[order].astype(np.int32)
+    counts = np.bincount(keys, minlength=num_nodes)
+    offsets = np.zeros(num_nodes + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    return offsets, flat
+
+
+def expand(offsets, neighbors, frontier):
+    """
+    Gathers the neighbours of every node in `frontier` in one vectorised step.
+    Returns (parents, children) arrays of equal length.
+    """
+    starts = offsets[frontier]
+    counts = offsets[frontier + 1] - starts
+    total = int(counts.sum())
+    if total == 0:
+        empty = np.empty(0, dtype=np.int32)
+        return empty, empty
+
+    parents = np.repeat(frontier, counts)
+    shift = np.repeat(starts - np.cumsum(counts) + counts, counts)
+    children = neighbors[shift + np.arange(total)]
+    return parents, children
+
+
+def weak_components(offsets, neighbors):
+    """
+    Weakly connected components by array union-find: every round hooks each
+    root onto the smallest root across its edges, then compresses all
+    pointers (pointer jumping) until every node points at its root.
+    Returns component labels 0..c-1, numbered by smallest member.
+    """
+    n = len(offsets) - 1
+    src = np.repeat(np.arange(n, dtype=np.int64), np.diff(offsets))
+    dst = np.asarray(neighbors, dtype=np.int64)
+    parent = np.arange(n, dtype=np.int64)
+
+    while True:
+        a, b = parent[src], parent[dst]
+        cross = a != b
+        if not cross.any():
+            break
+        low, high = np.minimum(a[cross], b[cross]), np.maximum(a[cross], b[cross])
+        np.minimum.at(parent, high, low)
+        while True:
+            grand = parent[parent]
+            if np.array_equal(grand, parent):
+                break
+            parent = grand
+
+    return np.unique(parent, return_inverse=True)[1].astype(np.int32)
+
+
+def strong_components(offsets, neighbors, rev_offsets):
+    """
+    Strongly connected components by iterative Tarjan.
+    Nodes without in- or out-edges are their own component and are trimmed
+    first, which leaves only the students' lists for the depth-first search.
+    Returns component labels 0..c-1 (singletons included).
+    """
+    n = len(offsets) - 1
+    labels = np.full(n, -1, dtype=np.int64)
+    trimmed = (np.diff(offsets) == 0) | (np.diff(rev_offsets) == 0)
+    # memoryviews and typed arrays index as fast as lists at a few bytes per
+    # entry instead of a boxed int each (and read mmapped arrays in place)
+    starts = memoryview(np.ascontiguousarray(offsets, dtype=np.int64))
+    nbrs = memoryview(np.ascontiguousarray(neighbors, dtype=np.int32))
+    skip = trimmed.tobytes()
+
+    index = array("q", [-1]) * n
+    low = array("q", [0]) * n
+    on_stack = bytearray(n)
+    stack = []
+    counter = 0
+    count = 0
+
+    for root in np.flatnonzero(~trimmed).tolist():
+        if index[root] != -1:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        work = [(root, starts[root])]
+
+        while work:
+            v, pos = work[-1]
+            end = starts[v + 1]
+            while pos < end:
+                w = nbrs[pos]
+                pos += 1
+                if skip[w]:
+                    continue
+                if index[w] == -1:
+                    break
+                if on_stack[w] and index[w] < low[v]:
+                    low[v] = index[w]
+            else:
+                # v is finished
+                work.pop()
+                if work:
+                    u = work[-1][0]
+                    if low[v] < low[u]:
+                        low[u] = low[v]
+                if low[v] == index[v]:
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = False
+                        labels[w] = count
+                        if w == v:
+                            break
+                    count += 1
+                continue
+
+            # descend into w
+            work[-1] = (v, pos)
+            index[w] = low[w] = counter
+            counter += 1
+            stack.append(w)
+            on_stack[w] = True
+            work.append((w, starts[w]))
+
+    singles = np.flatnonzero(labels == -1)
+    labels[singles] = count + np.arange(len(singles))
+    return labels.astype(np.int32)
+
+
+class NameTable:
+    """
+    Sorted list of names stored as one UTF-8 blob plus offsets.
+    Both arrays can be memory-mapped; names are decoded only when accessed.
+    """
+
+    def __init__(self, blob, offsets):
+        self.blob = blob
+        self.offsets = offsets
+
+    @classmethod
+    def from_names(cls, names):
+        encoded = [str(n).encode("utf-8") for n in names]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(b) for b in encoded], out=offsets[1:])
+        blob = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+        return cls(blob, offsets)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        start, end = self.offsets[i], self.offsets[i + 1]
+        return self.blob[start:end].tobytes().decode("utf-8")
+
+
+class GraphStore:
+    """
+    Compact directed graph keyed by integer IDs.
+
+    Every name is interned once (IDs follow sorted name order, so lookups are a
+    binary search) and adjacency is kept as NumPy CSR arrays for both the
+    forward (successors) and the reverse (predecessors) direction.
+    """
+
+    def __init__(self, names, offsets, neighbors, rev_offsets, rev_neighbors, wcc=None, scc=None):
+        self.names = names
+        self.offsets = offsets
+        self.neighbors = neighbors
+        self.rev_offsets = rev_offsets
+        self.rev_neighbors = rev_neighbors
+        self._symmetric = None
+        self._oriented = None
+        self._wcc = wcc
+        self._scc = scc
+
+    @classmethod
+    def from_edges(cls, sources, targets):
+        """
+        Builds the store from two equally long sequences of names.
+        Duplicate edges are dropped.
+        """
+        sources = pd.Series(sources, dtype=object).astype(str).str.strip()
+        targets = pd.Series(targets, dtype=object).astype(str).str.strip()
+        keep = (sources != "") & (targets != "")
+        sources, targets = sources[keep], targets[keep]
+
+        codes, names = pd.factorize(pd.concat([sources, targets], ignore_index=True), sort=True)
+        codes = codes.astype(np.int64)
+        src, tgt = codes[:len(sources)], codes[len(sources):]
+
+        num_nodes = len(names)
+        if len(src):
+            pairs = np.unique(src * num_nodes + tgt)
+            src, tgt = pairs // num_nodes, pairs % num_nodes
+
+        offsets, neighbors = build_csr(src, tgt, num_nodes)
+        rev_offsets, rev_neighbors = build_csr(tgt, src, num_nodes)
+        return cls(np.asarray(names, dtype=object), offsets, neighbors, rev_offsets, rev_neighbors)
+
+    @classmethod
+    def from_edge_chunks(cls, names, chunks, num_edges):
+        """
+        Builds the store from already deduped edges, read as (sources, targets)
+        name chunks, given every node name. Only integer IDs are kept between
+        chunks, so memory is a few bytes per edge rather than a DataFrame row.
+        """
+        names = sorted(names)
+        lookup = pd.Index(names)
+        src = np.empty(num_edges, dtype=np.int32)
+        tgt = np.empty(num_edges, dtype=np.int32)
+
+        pos = 0
+        for sources, targets in chunks:
+            end = pos + len(sources)
+            src[pos:end] = lookup.get_indexer(sources)
+            tgt[pos:end] = lookup.get_indexer(targets)
+            pos = end
+
+        offsets, neighbors = build_csr(src, tgt, len(names))
+        rev_offsets, rev_neighbors = build_csr(tgt, src, len(names))
+        return cls(NameTable.from_names(names), offsets, neighbors, rev_offsets, rev_neighbors)
+
+    # --- basic properties ---
+
+    def number_of_nodes(self):
+        return len(self.offsets) - 1
+
+    def number_of_edges(self):
+        return len(self.neighbors)
+
+    def density(self):
+        """Directed density, same definition as nx.density on a DiGraph."""
+        n = self.number_of_nodes()
+        if n <= 1:
+            return 0.0
+        return self.number_of_edges() / (n * (n - 1))
+
+    def out_degrees(self):
+        return np.diff(self.offsets)
+
+    def symmetric(self):
+        """
+        Undirected view as CSR (offsets, neighbors): every connection in both
+        directions, duplicates and self-loops removed. Built once and cached.
+        """
+        if self._symmetric is None:
+            n = self.number_of_nodes()
+            src = np.repeat(np.arange(n, dtype=np.int64), self.out_degrees())
+            tgt = np.asarray(self.neighbors, dtype=np.int64)
+            a, b = np.concatenate([src, tgt]), np.concatenate([tgt, src])
+            keep = a != b
+            pairs = np.unique(a[keep] * n + b[keep])
+            self._symmetric = build_csr(pairs // n, pairs % n, n)
+        return self._symmetric
+
+    def oriented(self):
+        """
+        Degree-ordered forward graph as CSR (offsets, neighbors): every
+        undirected edge points from the lower-ranked to the higher-ranked
+        endpoint (rank = degree, then ID). Out-degrees are then at most
+        sqrt(2m), so hubs only ever appear as short lists. Built once and cached.
+        """
+        if self._oriented is None:
+            offsets, neighbors = self.symmetric()
+            n = self.number_of_nodes()
+            degrees = np.diff(offsets)
+
+            rank = np.empty(n, dtype=np.int64)
+            rank[np.lexsort((np.arange(n), degrees))] = np.arange(n)
+
+            src = np.repeat(np.arange(n, dtype=np.int64), degrees)
+            dst = np.asarray(neighbors, dtype=np.int64)
+            forward = rank[src] < rank[dst]
+            self._oriented = build_csr(src[forward], dst[forward], n)
+        return self._oriented
+
+    def in_degrees(self):
+        return np.diff(self.rev_offsets)
+
+    # --- components ---
+
+    def components(self):
+        """
+        (wcc, scc) label arrays, one entry per node. Loaded from the snapshot
+        when present, otherwise computed once and cached.
+        """
+        if self._wcc is None:
+            self._wcc = weak_components(self.offsets, self.neighbors)
+        if self._scc is None:
+            self._scc = strong_components(self.offsets, self.neighbors, self.rev_offsets)
+        return self._wcc, self._scc
+
+    def may_reach(self, source, target, undirected=False):
+        """
+        O(1) reachability filter on node IDs. False means there is certainly
+        no path (different weak components, or source has no out-edges /
+        target no in-edges); True means a search is needed to find it.
+        """
+        if source == target:
+            return True
+        wcc, scc = self.components()
+        if wcc[source] != wcc[target]:
+            return False
+        if undirected or scc[source] == scc[target]:
+            return True
+        return (self.offsets[source + 1] > self.offsets[source]
+                and self.rev_offsets[target + 1] > self.rev_offsets[target])
+
+    # --- name lookups ---
+
+    def node_id(self, name):
+        """Returns the integer ID of `name` or raises NodeNotFound."""
+        name = str(name).strip()
+        i = bisect.bisect_left(self.names, name)
+        if i < len(self.names) and self.names[i] == name:
+            return i
+        raise NodeNotFound(f"Node {name} is not in the graph")
+
+    def __contains__(self, name):
+        try:
+            self.node_id(name)
+            return True
+        except NodeNotFound:
+            return False
+
+    def name(self, node):
+        return self.names[node]
+
+    def successors(self, node):
+        return self.neighbors[self.offsets[node]:self.offsets[node + 1]]
+
+    def predecessors(self, node):
+        return self.rev_neighbors[self.rev_offsets[node]:self.rev_offsets[node + 1]]
+
+    # --- search ---
+
+    def shortest_path(self, source, target, undirected=False):
+        """
+        Shortest path between two names (bidirectional BFS).
+        Returns the list of names on the path, or None if no path exists.
+        """
+        return self.search(source, target, undirected).path
+
+    def expand(self, frontier, forward=True, undirected=False):
+        """
+        (parents, children) for one BFS step; `forward` follows out-edges,
+        otherwise in-edges. undirected=True follows both.
+        """
+        if undirected:
+            p1, c1 = expand(self.offsets, self.neighbors, frontier)
+            p2, c2 = expand(self.rev_offsets, self.rev_neighbors, frontier)
+            return np.concatenate([p1, p2]), np.concatenate([c1, c2])
+        if forward:
+            return expand(self.offsets, self.neighbors, frontier)
+        return expand(self.rev_offsets, self.rev_neighbors, frontier)
+
+    def search(self, source, target, undirected=False):
+        """
+        Bidirectional breadth-first search.
+
+        Grows a forward frontier from `source` (out-edges) and a backward
+        frontier from `target` (in-edges), always expanding the side with
+        fewer edges to scan, one full level at a time, until they meet.
+        undirected=True treats every connection as symmetric.
+        Returns a PathResult(path, expanded, seconds).
+        """
+        started = time.perf_counter()
+        s, t = self.node_id(source), self.node_id(target)
+        if s == t:
+            return PathResult([self.name(s)], 0, time.perf_counter() - started)
+        if not self.may_reach(s, t, undirected):
+            return PathResult(None, 0, time.perf_counter() - started)
+
+        n = self.number_of_nodes()
+        parent = [np.full(n, -1, dtype=np.int64), np.full(n, -1, dtype=np.int64)]
+        dist = [np.full(n, -1, dtype=np.int32), np.full(n, -1, dtype=np.int32)]
+        frontier = [np.array([s], dtype=np.int64), np.array([t], dtype=np.int64)]
+        for side, root in ((0, s), (1, t)):
+            parent[side][root] = root
+            dist[side][root] = 0
+
+        offsets = [self.offsets, self.rev_offsets]
+        expanded = 0
+
+        while len(frontier[0]) and len(frontier[1]):
+            cost = []
+            for i in (0, 1):
+                f = frontier[i]
+                sides = (0, 1) if undirected else (i,)
+                cost.append(sum(int((offsets[j][f + 1] - offsets[j][f]).sum()) for j in sides))
+            side = 0 if cost[0] <= cost[1] else 1
+            other = 1 - side
+
+            expanded += len(frontier[side])
+            parents, children = self.expand(frontier[side], forward=(side == 0), undirected=undirected)
+            fresh = dist[side][children] == -1
+            parents, children = parents[fresh], children[fresh]
+            # first parent wins, so the result does not depend on hash order
+            children, first = np.unique(children, return_index=True)
+            parent[side][children] = parents[first]
+            dist[side][children] = dist[side][frontier[side][0]] + 1
+
+            meet = children[dist[other][children] != -1]
+            if len(meet):
+                best = int(meet[np.argmin(dist[other][meet])])
+                path = [best]
+                while path[-1] != s:
+                    path.append(int(parent[0][path[-1]]))
+                path.reverse()
+                while path[-1] != t:
+                    path.append(int(parent[1][path[-1]]))
+                return PathResult([self.name(i) for i in path], expanded, time.perf_counter() - started)
+
+            frontier[side] = children
+
+        return PathResult(None, expanded, time.perf_counter() - started)
+
+    def bfs(self, source, undirected=False, forward=True):
+        """
+        Full breadth-first search tree from one node ID; forward=False
+        follows in-edges (distances *to* the source).
+        Returns (parent, dist) arrays; unreachable nodes have dist -1.
+        """
+        n = self.number_of_nodes()
+        parent = np.full(n, -1, dtype=np.int64)
+        dist = np.full(n, -1, dtype=np.int32)
+        parent[source] = source
+        dist[source] = 0
+        frontier = np.array([source], dtype=np.int64)
+        level = 0
+
+        while len(frontier):
+            level += 1
+            parents, children = self.expand(frontier, forward=forward, undirected=undirected)
+            fresh = dist[children] == -1
+            parents, children = parents[fresh], children[fresh]
+            children, first = np.unique(children, return_index=True)
+            parent[children] = parents[first]
+            dist[children] = level
+            frontier = children
+
+        return parent, dist
+
+    def tree_path(self, parent, target):
+        """Names on the BFS-tree path to `target`, or None if it was not reached."""
+        if parent[target] == -1:
+            return None
+        path = [target]
+        while parent[path[-1]] != path[-1]:
+            path.append(int(parent[path[-1]]))
+        return [self.name(i) for i in reversed(path)]
+
+    # --- views ---
+
+    def to_networkx(self):
+        """Builds a networkx DiGraph view; only call this when networkx is really needed."""
+        import networkx as nx
+
+        names = np.array([self.name(i) for i in range(self.number_of_nodes())], dtype=object)
+        G = nx.DiGraph()
+        G.add_nodes_from(names)
+        src = np.repeat(np.arange(self.number_of_nodes()), self.out_degrees())
+        G.add_edges_from(zip(names[src], names[self.neighbors]))
+        return G
+
+
+# --- binary snapshot ---
+
+STALE_SECONDS = 60  # unreferenced array generations younger than this may belong to a concurrent writer
+
+
+def default_snapshot_dir(edge_file="data/edges.csv"):
+    """graph_snapshot/<edge file stem>/ next to the edge list, so every edge list has its own snapshot."""
+    stem = os.path.splitext(os.path.basename(edge_file))[0]
+    return os.path.join(os.path.dirname(edge_file), "graph_snapshot", stem)
+
+
+def source_signature(edge_file):
+    st = os.stat(edge_file)
+    return {"edge_file": os.path.basename(edge_file), "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+def read_meta(directory):
+    """meta.json of a snapshot-style directory, or {} when it is missing or unreadable."""
+    try:
+        with open(os.path.join(directory, "meta.json"), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_arrays(directory, arrays, meta):
+    """
+    Writes `arrays` as .npy files into a new, uniquely named generation
+    directory and then points meta.json at it with an atomic replace.
+    Files another process has memory-mapped are never rewritten in place
+    (that would crash it with SIGBUS); readers see either the old or the
+    new generation. Generations older than the one just replaced are
+    removed, best effort (Windows refuses while they are still mapped).
+    """
+    os.makedirs(directory, exist_ok=True)
+    generation = tempfile.mkdtemp(prefix="arrays-", dir=directory)
+    for key, array in arrays.items():
+        np.save(os.path.join(generation, f"{key}.npy"), np.ascontiguousarray(array))
+
+    previous = read_meta(directory).get("arrays")
+    meta = dict(meta, arrays=os.path.basename(generation))
+    tmp_path = os.path.join(directory, f"meta.json.{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=2)
+    os.replace(tmp_path, os.path.join(directory, "meta.json"))
+
+    keep = {meta["arrays"], previous}
+    now = time.time()
+    for entry in os.listdir(directory):
+        path = os.path.join(directory, entry)
+        try:
+            if entry.startswith("arrays-") and entry not in keep and now - os.path.getmtime(path) > STALE_SECONDS:
+                shutil.rmtree(path)
+            elif entry.endswith(".npy"):  # flat layout of older versions
+                os.remove(path)
+        except OSError:
+            pass
+
+
+def load_arrays(directory, keys, mmap=True):
+    """
+    Loads the arrays of the generation meta.json points to (memory-mapped
+    read-only with mmap=True). Retries once if a writer swapped generations
+    in between.
+    """
+    mode = "r" if mmap else None
+    for attempt in range(2):
+        base = os.path.join(directory, read_meta(directory).get("arrays", ""))
+        try:
+            return {key: np.load(os.path.join(base, f"{key}.npy"), mmap_mode=mode) for key in keys}
+        except FileNotFoundError:
+            if attempt:
+                raise
+
+
+def write_snapshot(store, snapshot_dir, edge_file):
+    """Saves the store as .npy arrays plus meta.json (see save_arrays)."""
+    names = store.names if isinstance(store.names, NameTable) else NameTable.from_names(store.names)
+    wcc, scc = store.components()
+    arrays = {
+        "names_blob": names.blob,
+        "names_offsets": names.offsets,
+        "offsets": store.offsets,
+        "neighbors": store.neighbors,
+        "rev_offsets": store.rev_offsets,
+        "rev_neighbors": store.rev_neighbors,
+        "wcc": wcc,
+        "scc": scc,
+    }
+    meta = {
+        "version": SNAPSHOT_VERSION,
+        "nodes": store.number_of_nodes(),
+        "edges": store.number_of_edges(),
+        "weak_components": int(wcc.max()) + 1 if len(wcc) else 0,
+        "strong_components": int(scc.max()) + 1 if len(scc) else 0,
+        "source": source_signature(edge_file),
+    }
+    save_arrays(snapshot_dir, {key: arrays[key] for key in SNAPSHOT_ARRAYS}, meta)
+
+    print(f" Graph snapshot saved --> {snapshot_dir}")
+
+
+def snapshot_is_fresh(snapshot_dir, edge_file):
+    """
+    True when the snapshot exists, has the current format version and was
+    built from the current edges.csv (same size and mtime).
+    """
+    if not os.path.exists(edge_file):
+        return False
+    meta = read_meta(snapshot_dir)
+    return meta.get("version") == SNAPSHOT_VERSION and meta.get("source") == source_signature(edge_file)
+
+
+def load_snapshot(snapshot_dir, mmap=True):
+    """
+    Loads a snapshot; with mmap=True the arrays are memory-mapped read-only,
+    so startup is near-instant and pages are shared between processes.
+    """
+    arrays = load_arrays(snapshot_dir, SNAPSHOT_ARRAYS, mmap)
+    names = NameTable(arrays["names_blob"], arrays["names_offsets"])
+    return GraphStore(names, arrays["offsets"], arrays["neighbors"], arrays["rev_offsets"], arrays["rev_neighbors"],
+                      wcc=arrays["wcc"], scc=arrays["scc"])
+
+
+_STORE_CACHE = {}
+
+
+def get_graph_store(edge_file="data/edges.csv", snapshot_dir=None):
+    """
+    Cached load_graph_store: one store per process and edge file, reloaded
+    only when edges.csv changes on disk.
+    """
+    st = os.stat(edge_file)
+    key = os.path.abspath(edge_file)
+    stamp = (st.st_size, st.st_mtime_ns)
+
+    cached = _STORE_CACHE.get(key)
+    if cached is None or cached[0] != stamp:
+        cached = (stamp, load_graph_store(edge_file, snapshot_dir))
+        _STORE_CACHE[key] = cached
+    return cached[1]
+
+
+def load_graph_store(edge_file="data/edges.csv", snapshot_dir=None, mmap=True):
+    """
+    Returns the GraphStore for edges.csv.
+    Uses the binary snapshot when it is fresh; otherwise parses the CSV and
+    refreshes the snapshot for the next run.
+    """
+    if snapshot_dir is None:
+        snapshot_dir = default_snapshot_dir(edge_file)
+
+    if snapshot_is_fresh(snapshot_dir, edge_file):
+        return load_snapshot(snapshot_dir, mmap=mmap)
+
+    df = pd.read_csv(edge_file, dtype=str, keep_default_na=False)
+    src, tgt = edge_columns(df)
+    store = GraphStore.from_edges(df[src], df[tgt])
+
+    try:
+        write_snapshot(store, snapshot_dir, edge_file)
+    except OSError as e:
+        print(f" Could not write graph snapshot: {e}")
+
+    return store
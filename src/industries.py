@@ -0,0 +1,108 @@
+import hashlib
+import json
+import os
+import re
+import pandas as pd
+
+OTHER = "Other"
+
+
+def load_taxonomy(taxonomy_file="config/industries.json"):
+    """Ordered {category: [keywords]} from the taxonomy config."""
+    with open(taxonomy_file, encoding="utf-8") as f:
+        return json.load(f)["categories"]
+
+
+def keyword_pattern(keyword):
+    """
+    Regex for one keyword: a whole word (phrases match across any whitespace);
+    a trailing * also matches longer words starting with it, a leading *
+    longer words ending with it ("*tech" matches "HCLTech").
+    """
+    keyword = keyword.strip().lower()
+    prefix = r"\w*" if keyword.startswith("*") else ""
+    suffix = r"\w*" if keyword.endswith("*") else ""
+    words = keyword.strip("*").split()
+    return prefix + r"\s+".join(re.escape(w) for w in words) + suffix
+
+
+def compile_taxonomy(taxonomy):
+    """
+    One compiled alternation for the whole taxonomy, one named group per
+    category, all anchored on word boundaries (so "it" no longer matches
+    "Citi"). A single scan of a company name finds every category hit.
+    """
+    groups = []
+    for i, words in enumerate(taxonomy.values()):
+        alternatives = "|".join(sorted((keyword_pattern(w) for w in words if w.strip()), key=len, reverse=True))
+        if alternatives:
+            groups.append(f"(?P<c{i}>{alternatives})")
+    return re.compile(r"\b(?:" + "|".join(groups) + r")\b", re.IGNORECASE)
+
+
+class IndustryClassifier:
+    """
+    Maps company names to taxonomy categories.
+
+    Every distinct company is classified once; results are kept in a JSON
+    cache keyed by a hash of the taxonomy, so later runs only classify new
+    companies and editing the config invalidates the cache automatically.
+    """
+
+    def __init__(self, taxonomy_file="config/industries.json", cache_file="data/industry_cache.json"):
+        self.taxonomy = load_taxonomy(taxonomy_file)
+        self.categories = list(self.taxonomy)
+        self.pattern = compile_taxonomy(self.taxonomy)
+        self.digest = hashlib.sha1(json.dumps(self.taxonomy, sort_keys=True).encode("utf-8")).hexdigest()
+        self.cache_file = cache_file
+        self.cache = self.load_cache()
+
+    def load_cache(self):
+        if not self.cache_file or not os.path.exists(self.cache_file):
+            return {}
+        try:
+            with open(self.cache_file, encoding="utf-8") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return cached.get("companies", {}) if cached.get("taxonomy") == self.digest else {}
+
+    def save_cache(self):
+        if not self.cache_file:
+            return
+        os.makedirs(os.path.dirname(self.cache_file) or ".", exist_ok=True)
+        with open(self.cache_file, "w", encoding="utf-8") as f:
+            json.dump({"taxonomy": self.digest, "companies": self.cache}, f, ensure_ascii=False)
+
+    def classify(self, company):
+        """Category of one company name: the earliest category in the taxonomy with a keyword hit."""
+        if company is None or pd.isna(company):
+            return OTHER
+        hits = [int(m.lastgroup[1:]) for m in self.pattern.finditer(str(company))]
+        return self.categories[min(hits)] if hits else OTHER
+
+    def classify_all(self, companies):
+        """{company: category} for the distinct companies given, using and updating the cache."""
+        result = {}
+        new = 0
+        for company in pd.unique(pd.Series(list(companies), dtype=object).dropna().astype(str)):
+            if company not in self.cache:
+                self.cache[company] = self.classify(company)
+                new += 1
+            result[company] = self.cache[company]
+        if new:
+            self.save_cache()
+        return result
+
+    def industry_counts(self, counts):
+        """
+        Sums a Series of counts per company into counts per category, in
+        taxonomy order with Other last (missing companies count as Other).
+        """
+        known = counts[counts.index.notna()]
+        mapping = self.classify_all(known.index)
+        industries = pd.Series(known.values, index=[mapping[str(c)] for c in known.index], dtype="int64")
+        totals = industries.groupby(level=0).sum()
+        totals = totals.reindex(self.categories + [OTHER], fill_value=0)
+        totals[OTHER] += int(counts[counts.index.isna()].sum())
+        return totals
@@ -0,0 +1,98 @@
+import os
+import pandas as pd
+from naming import student_for
+
+
+def extract_name_column(df):
+    """
+    Detects the column that contains connection names.
+    Works even if column names vary.
+    """
+    possible_cols = ["name", "full name", "first name", "connection", "connections"]
+
+    df_cols_lower = [c.lower().strip() for c in df.columns]
+
+    # match any possible column
+    for col in possible_cols:
+        if col in df_cols_lower:
+            return df.columns[df_cols_lower.index(col)]
+
+    return df.columns[0]
+
+
+def find_connection_column(df):
+    """
+    Detects the correct connection column name in any file.
+    """
+    for col in df.columns:
+        if col.strip().lower().replace(" ", "_") == "connected_to":
+            return col
+
+    # fallback: first column
+    return df.columns[0]
+
+
+def connection_edges(student, connections):
+    """
+    Turns one student's connection values into (student, connection) edges.
+    """
+    edges = []
+    for conn in pd.Series(connections).dropna():
+        conn = str(conn).strip()
+        if conn:
+            edges.append((student, conn))
+    return edges
+
+
+def ingest_file(job):
+    """
+    Reads one file once and writes its adjacency list and connected_to copy.
+    This is the only reader of cleaned/adjacency files: the standalone
+    builders, the manifest pipeline and the columnar import all go through it.
+
+    `job` is (kind, inp_path, adjacency_out, connections_out); kind is
+    "cleaned" for a cleaned export or "adjacency" for an adjacency file.
+    Either output path may be None to skip writing it. Returns
+    (student, connections, company_counts, message); connections is None
+    on failure.
+    """
+    kind, inp_path, adjacency_out, connections_out = job
+    file = os.path.basename(inp_path)
+    student = student_for(file)
+
+    try:
+        df = pd.read_csv(inp_path)
+
+        if kind == "cleaned":
+            connections = df[extract_name_column(df)].dropna().unique()
+        else:
+            connections = df[find_connection_column(df)].dropna().unique()
+
+        for out in (adjacency_out if kind == "cleaned" else None, connections_out):
+            if out:
+                pd.DataFrame({"connected_to": connections}).to_csv(out, index=False)
+
+        companies = None
+        if "Company" in df.columns:
+            companies = df["Company"].value_counts(dropna=False)
+
+        return student, connections, companies, f" {student}: {len(connections)} connections"
+
+    except Exception as e:
+        return student, None, None, f" Failed for {file}: {e}"
+
+
+def ingest_jobs(cleaned_folder, adjacency_folder, connections_output):
+    """
+    One job per cleaned file, plus one per adjacency file with no cleaned source.
+    """
+    cleaned = {f for f in os.listdir(cleaned_folder) if f.endswith(".csv")}
+    existing = {f for f in os.listdir(adjacency_folder) if f.endswith(".csv")}
+
+    jobs = []
+    for file in sorted(cleaned | existing):
+        kind, folder = ("cleaned", cleaned_folder) if file in cleaned else ("adjacency", adjacency_folder)
+        jobs.append((kind, os.path.join(folder, file),
+                     os.path.join(adjacency_folder, file),
+                     os.path.join(connections_output, file)))
+    return jobs
@@ -0,0 +1,126 @@
+import os
+import numpy as np
+import pandas as pd
+from companies import load_company_table
+from name_index import get_name_index, normalize
+from naming import student_for
+
+
+def undirected_degrees(store, nodes):
+    return (store.offsets[nodes + 1] - store.offsets[nodes]
+            + store.rev_offsets[nodes + 1] - store.rev_offsets[nodes])
+
+
+def personalized_pagerank(store, seeds, alpha=0.15, eps=1e-6):
+    """
+    Approximate personalized PageRank by local push (Andersen-Chung-Lang).
+
+    Mass starts spread evenly over `seeds` (node IDs). Every node whose
+    residual is at least eps * degree keeps alpha of it and spreads the rest
+    over its connections (both directions, since introductions are mutual);
+    all such nodes are pushed together in one vectorised round. Estimates
+    and residuals are dicts over the nodes touched so far, so the work and
+    memory depend on 1/eps rather than on the graph size.
+    Returns {node_id: score}.
+    """
+    seeds = np.unique(np.asarray(list(seeds), dtype=np.int64))
+    if not len(seeds):
+        return {}
+
+    estimate = {}
+    residual = dict.fromkeys(seeds.tolist(), 1.0 / len(seeds))
+    active = seeds
+
+    while len(active):
+        mass = np.array([residual.pop(v) for v in active.tolist()])
+        degrees = undirected_degrees(store, active)
+
+        # dead ends keep their whole residual
+        kept = np.where(degrees == 0, mass, alpha * mass)
+        for v, m in zip(active.tolist(), kept.tolist()):
+            estimate[v] = estimate.get(v, 0.0) + m
+
+        live = degrees > 0
+        active, share = active[live], (1.0 - alpha) * mass[live] / degrees[live]
+        if not len(active):
+            break
+
+        # active is sorted, so every edge finds its parent's share by binary search
+        parents, children = store.expand(active, undirected=True)
+        children, slot = np.unique(children, return_inverse=True)
+        pushed = np.bincount(slot, weights=share[np.searchsorted(active, parents)], minlength=len(children))
+        values = []
+        for v, m in zip(children.tolist(), pushed.tolist()):
+            residual[v] = r = residual.get(v, 0.0) + m
+            values.append(r)
+
+        active = children[np.array(values) >= eps * np.maximum(undirected_degrees(store, children), 1)]
+
+    return {v: score for v, score in estimate.items() if score > 0}
+
+
+def company_members(company, table_file="data/company_table.csv", cleaned_folder="data/cleaned"):
+    """
+    Names of everyone whose Company matches `company` (same normalised key
+    as in the company table). The table tells which students have
+    connections there, so only those students' cleaned files are read.
+    """
+    key = normalize(company) or company.strip()
+    table = load_company_table(table_file, cleaned_folder)
+    students = set(table.loc[table["Key"] == key, "Student"])
+    members = set()
+
+    for file in sorted(os.listdir(cleaned_folder)):
+        if file.endswith(".csv") and student_for(file) in students:
+            df = pd.read_csv(os.path.join(cleaned_folder, file), usecols=["Full Name", "Company"])
+            names = {c for c in df["Company"].dropna().unique() if (normalize(str(c)) or str(c).strip()) == key}
+            members.update(df.loc[df["Company"].isin(names), "Full Name"].dropna().astype(str).str.strip())
+
+    return members
+
+
+def find_introducers(student, target=None, company=None, k=10, edge_file="data/edges.csv",
+                     cleaned_folder="data/cleaned", table_file="data/company_table.csv", alpha=0.15, eps=1e-6):
+    """
+    Top-k people who best connect `student` to another student (`target`)
+    or to anyone working at `company`.
+
+    Runs local-push personalized PageRank from the student and from the
+    target side, and ranks intermediaries by the product of both scores:
+    high only for people close to both ends. Uses the cached graph store.
+    Returns a list of (name, score).
+    """
+    index = get_name_index(edge_file)
+    store = index.store
+    s = index.resolve(student)
+
+    if target is not None:
+        target_ids = [index.resolve(target)]
+        label = target
+    elif company is not None:
+        target_ids = [store.node_id(m) for m in company_members(company, table_file, cleaned_folder) if m in store]
+        label = f"people at {company}"
+    else:
+        raise ValueError("Give a target student or a company")
+
+    print(f"\nWho can introduce {student} to {label}:")
+    if not target_ids:
+        print(" No one from that company is in the graph.")
+        return []
+
+    from_student = personalized_pagerank(store, [s], alpha, eps)
+    from_target = personalized_pagerank(store, target_ids, alpha, eps)
+
+    # aliases of either end (see name_index.load_aliases) are not intermediaries
+    ends = set().union(*(index.same_person(v) for v in (s, *target_ids)))
+    scores = {v: from_student[v] * from_target[v] for v in from_student.keys() & from_target.keys() if v not in ends}
+    top = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:k]
+
+    if not top:
+        print(" No intermediaries found (try a smaller eps).")
+        return []
+
+    results = [(store.name(v), score) for v, score in top]
+    for rank, (name, score) in enumerate(results, 1):
+        print(f" {rank:>2}. {name} ({score:.3e})")
+    return results
@@ -0,0 +1,259 @@
+import argparse
+import os
+import time
+import numpy as np
+import pandas as pd
+from graph_store import (NodeNotFound, edge_columns, get_graph_store, load_arrays, load_graph_store, read_meta,
+                         save_arrays, source_signature)
+from name_index import get_name_index
+from parallel import map_files
+
+LANDMARK_VERSION = 2
+UNREACHED = 255  # uint8 marker for "no path"; real distances are capped at 254
+LANDMARK_ARRAYS = ["landmarks", "forward", "backward", "symmetric"]
+
+
+def pick_landmarks(store, degree_file="data/degree.csv", k=16):
+    """
+    IDs of the k highest-degree students from degree.csv that are in the graph.
+    Falls back to in+out degree in the store when degree.csv is missing.
+    """
+    ids = []
+    if os.path.exists(degree_file):
+        degrees = pd.read_csv(degree_file).sort_values(by="Degree", ascending=False, kind="stable")
+        for student in degrees["Student"].astype(str):
+            if student in store:
+                ids.append(store.node_id(student))
+                if len(ids) == k:
+                    break
+
+    if len(ids) < k:
+        total = store.out_degrees() + store.in_degrees()
+        for node in np.argsort(-total, kind="stable").tolist():
+            if node not in ids:
+                ids.append(node)
+                if len(ids) == k:
+                    break
+
+    return np.array(ids, dtype=np.int64)
+
+
+def compact(dist):
+    """BFS int32 distances (-1 = unreached) as uint8."""
+    return np.where(dist < 0, UNREACHED, np.minimum(dist, UNREACHED - 1)).astype(np.uint8)
+
+
+def landmark_distances(job):
+    """
+    Worker job: the three BFS runs of one landmark.
+    Returns (from landmark, to landmark, undirected) uint8 distance rows.
+    """
+    edge_file, landmark = job
+    store = get_graph_store(edge_file)
+    _, forward = store.bfs(landmark)
+    _, backward = store.bfs(landmark, forward=False)
+    _, symmetric = store.bfs(landmark, undirected=True)
+    return compact(forward), compact(backward), compact(symmetric)
+
+
+class LandmarkOracle:
+    """
+    Approximate shortest-path distances from precomputed landmark BFS rows.
+
+    forward[i, v] is the distance from landmark i to v, backward[i, v] from v
+    to landmark i, symmetric[i, v] the undirected distance; all uint8 and
+    memory-mapped, so a query only gathers k bytes per endpoint.
+    """
+
+    def __init__(self, store, landmarks, forward, backward, symmetric):
+        self.store = store
+        self.landmarks = landmarks
+        self.forward = forward
+        self.backward = backward
+        self.symmetric = symmetric
+
+    def bounds(self, sources, targets, undirected=False):
+        """
+        Lower and upper bounds on d(source, target) for arrays of node IDs, in O(k) per pair.
+
+        Upper: best detour through one landmark. Lower: triangle inequality,
+        e.g. d(L, t) - d(L, s). Returns float arrays; a lower bound of inf
+        means there is certainly no path, an upper bound of inf that no
+        landmark links the pair.
+        """
+        s = np.atleast_1d(np.asarray(sources, dtype=np.int64))
+        t = np.atleast_1d(np.asarray(targets, dtype=np.int64))
+        if undirected:
+            into, out_of = self.symmetric, self.symmetric
+        else:
+            into, out_of = self.forward, self.backward
+
+        from_s = out_of[:, s].astype(np.float64)  # d(s, L)
+        to_t = into[:, t].astype(np.float64)      # d(L, t)
+        to_s = into[:, s].astype(np.float64)      # d(L, s)
+        from_t = out_of[:, t].astype(np.float64)  # d(t, L)
+        for a in (from_s, to_t, to_s, from_t):
+            a[a == UNREACHED] = np.inf
+
+        upper = (from_s + to_t).min(axis=0)
+
+        with np.errstate(invalid="ignore"):
+            # inf - finite = inf is a proof of unreachability (L reaches s but not t)
+            gaps = np.concatenate([to_t - to_s, from_s - from_t])
+        gaps[np.isnan(gaps)] = 0.0
+        lower = np.maximum(gaps.max(axis=0), 0.0)
+
+        wcc, _ = self.store.components()
+        lower[wcc[s] != wcc[t]] = np.inf
+        upper[np.isinf(lower)] = np.inf
+
+        same = s == t
+        lower[same] = upper[same] = 0.0
+        lower[~same] = np.maximum(lower[~same], 1.0)
+        return lower, upper
+
+
+def write_landmarks(oracle, output_dir, edge_file):
+    """Saves the landmark rows as .npy arrays plus meta.json (see graph_store.save_arrays)."""
+    meta = {
+        "version": LANDMARK_VERSION,
+        "landmarks": [oracle.store.name(int(i)) for i in oracle.landmarks],
+        "source": source_signature(edge_file),
+    }
+    save_arrays(output_dir, {key: getattr(oracle, key) for key in LANDMARK_ARRAYS}, meta)
+
+    print(f" Landmark distances saved → {output_dir}")
+
+
+def landmarks_are_fresh(output_dir, edge_file, k=None):
+    """True when the landmark files were built from the current edges.csv (and with k landmarks, if given)."""
+    if not os.path.exists(edge_file):
+        return False
+    meta = read_meta(output_dir)
+    if k is not None and len(meta.get("landmarks", [])) != k:
+        return False
+    return meta.get("version") == LANDMARK_VERSION and meta.get("source") == source_signature(edge_file)
+
+
+def build_landmarks(edge_file="data/edges.csv", degree_file="data/degree.csv",
+                    output_dir="data/landmarks", k=16, workers=1):
+    """
+    Picks k high-degree landmarks, runs the BFS rows in parallel and saves them.
+    Returns the LandmarkOracle.
+    """
+    store = load_graph_store(edge_file)  # refreshes the snapshot the workers map
+    landmarks = pick_landmarks(store, degree_file, k)
+
+    started = time.perf_counter()
+    jobs = [(edge_file, int(landmark)) for landmark in landmarks]
+    rows = list(map_files(landmark_distances, jobs, workers))
+
+    n = store.number_of_nodes()
+    forward, backward, symmetric = (
+        np.vstack([row[i] for row in rows]) if rows else np.zeros((0, n), dtype=np.uint8)
+        for i in range(3)
+    )
+    oracle = LandmarkOracle(store, landmarks, forward, backward, symmetric)
+
+    print(f" {len(landmarks)} landmark BFS runs in {time.perf_counter() - started:.2f} s "
+          f"({forward.nbytes * 3 / 1e6:.1f} MB)")
+    write_landmarks(oracle, output_dir, edge_file)
+    return oracle
+
+
+def load_landmarks(edge_file="data/edges.csv", degree_file="data/degree.csv",
+                   output_dir="data/landmarks", k=16, workers=1):
+    """
+    Returns the LandmarkOracle, memory-mapped from disk when it is fresh,
+    otherwise rebuilt.
+    """
+    if not landmarks_are_fresh(output_dir, edge_file, k):
+        return build_landmarks(edge_file, degree_file, output_dir, k, workers)
+
+    arrays = load_arrays(output_dir, LANDMARK_ARRAYS)
+    return LandmarkOracle(get_graph_store(edge_file), arrays["landmarks"],
+                          arrays["forward"], arrays["backward"], arrays["symmetric"])
+
+
+def resolve_or_missing(index, name):
+    """Node ID of `name` through the name index, or -1 when it is unknown."""
+    try:
+        return index.resolve(name)
+    except NodeNotFound:
+        return -1
+
+
+def estimate_separation(student1, student2, edge_file="data/edges.csv", undirected=False, **options):
+    """
+    Prints and returns (lower, upper) bounds on the separation of two students.
+    """
+    oracle = load_landmarks(edge_file, **options)
+    index = get_name_index(edge_file)
+    lower, upper = oracle.bounds([index.resolve(student1)], [index.resolve(student2)], undirected)
+    lower, upper = float(lower[0]), float(upper[0])
+
+    if np.isinf(lower):
+        print("\n No path exists between these students.")
+    elif np.isinf(upper):
+        print(f"\n Separation: at least {lower:.0f} (no landmark links them; use the exact search)")
+    elif lower == upper:
+        print(f"\n Separation: exactly {lower:.0f}")
+    else:
+        print(f"\n Separation: between {lower:.0f} and {upper:.0f}")
+    return lower, upper
+
+
+def estimate_batch(pairs_file, output_file="data/separation_estimates.csv", edge_file="data/edges.csv",
+                   undirected=False, chunk_size=200000, **options):
+    """
+    Landmark bounds for every (source, target) pair in pairs_file, answered
+    in vectorised chunks of chunk_size pairs.
+    Writes Source, Target, Lower, Upper, Status rows to output_file; bounds
+    are empty when a name is unknown or there is no path.
+    """
+    oracle = load_landmarks(edge_file, **options)
+    index = get_name_index(edge_file)
+
+    pairs = pd.read_csv(pairs_file, dtype=str, keep_default_na=False)
+    src, tgt = edge_columns(pairs)
+    pairs = pairs[[src, tgt]].apply(lambda col: col.str.strip())
+    pairs.columns = ["Source", "Target"]
+
+    started = time.perf_counter()
+    names = pd.unique(pd.concat([pairs["Source"], pairs["Target"]], ignore_index=True))
+    ids = pd.Series({name: resolve_or_missing(index, name) for name in names}, dtype=np.int64)
+    s = pairs["Source"].map(ids).to_numpy()
+    t = pairs["Target"].map(ids).to_numpy()
+    known = (s >= 0) & (t >= 0)
+
+    lower = np.full(len(pairs), np.nan)
+    upper = np.full(len(pairs), np.nan)
+    rows = np.flatnonzero(known)
+    for start in range(0, len(rows), chunk_size):
+        chunk = rows[start:start + chunk_size]
+        lower[chunk], upper[chunk] = oracle.bounds(s[chunk], t[chunk], undirected)
+
+    status = np.where(~known, "not found",
+                      np.where(np.isinf(lower), "no path",
+                               np.where(np.isinf(upper), "lower bound only", "ok")))
+    lower[np.isinf(lower)] = np.nan
+    upper[np.isinf(upper)] = np.nan
+
+    pairs["Lower"] = pd.array(lower, dtype="Float64").astype("Int64")
+    pairs["Upper"] = pd.array(upper, dtype="Float64").astype("Int64")
+    pairs["Status"] = status
+    pairs.to_csv(output_file, index=False, encoding="utf-8-sig")
+
+    print(f"\n Estimated {len(pairs)} pairs in {time.perf_counter() - started:.2f} s "
+          f"({int((status == 'ok').sum())} bounded, {int((lower == upper).sum())} exact)")
+    print(f" Estimates saved → {output_file}")
+    return pairs
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the landmark distance oracle.")
+    parser.add_argument("-k", type=int, default=16, help="number of landmarks")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    build_landmarks(k=args.k, workers=args.workers)
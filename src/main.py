@@ -1,29 +1,60 @@
+import argparse
 import os
-from cleaner import clean_all
-from adjacency_builder import build_adjacency
-from degree_builder import build_degrees
-from graph_builder import build_graph
+from centrality import compute_centrality
+from clustering import build_clustering
+from communities import detect_communities
+from influence import build_influence
+from landmarks import build_landmarks
+from manifest import update_pipeline
+from neighborhood import build_neighborhood
+from recommendations import build_recommendations
+from visualize_graph import export_interactive
 from visualizer import generate_all_plots
 
 RAW_DATA_PATH = r"C:\Users\INDIAN  OIL\Downloads\LinkedIn Data Public\LinkedIn Data Public"
+WORKERS = os.cpu_count() or 1
 
-def main():
-    print("\n STEP 1: Cleaning raw LinkedIn data...")
-    clean_all(RAW_DATA_PATH, output_dir="data/cleaned")
+def main(full=False):
+    print("\n STEP 1-2: Cleaning raw LinkedIn data and building adjacency lists, degree file, edge list and company table...")
+    if full:
+        print(" (--full: re-cleaning and re-ingesting every file)")
+    update_pipeline(RAW_DATA_PATH, "data/cleaned", "data/adjacency", "data/degree.csv", "data/connected_to",
+                    "data/edges.csv", "data/company_table.csv", "data/manifest.json",
+                    workers=WORKERS, full=full)
 
-    print("\n STEP 2: Creating adjacency lists...")
-    build_adjacency("data/cleaned", "data/adjacency")
+    print("\n STEP 3: Computing random-walk influence scores...")
+    build_influence("data/edges.csv", "data/random_walk_output.csv")
 
-    print("\n STEP 3: Building degree file...")
-    build_degrees("data/adjacency", "data/degree.csv", "data/connected_to")
+    print("\n STEP 4: Computing sampled betweenness/closeness and eigenvector centrality...")
+    compute_centrality("data/edges.csv", "data/centrality.csv", workers=WORKERS)
 
-    print("\n STEP 4: Building edge list for full network graph...")
-    build_graph("data/adjacency", "data/edges.csv")
+    print("\n STEP 5: Counting triangles and clustering coefficients...")
+    build_clustering("data/edges.csv", "data/clustering.csv", workers=WORKERS)
 
-    print("\n STEP 5: Generating all visualizations...")
+    print("\n STEP 6: Building the landmark distance oracle...")
+    build_landmarks("data/edges.csv", "data/degree.csv", "data/landmarks", workers=WORKERS)
+
+    print("\n STEP 7: Detecting communities...")
+    detect_communities("data/edges.csv", "data/cleaned", "data/communities.csv",
+                       "data/community_summary.csv", "data/community_companies.csv")
+
+    print("\n STEP 8: Building people-you-may-know recommendations...")
+    build_recommendations("data/edges.csv", "data/recommendations.csv", workers=WORKERS)
+
+    print("\n STEP 9: Estimating 2/3/4-hop reach (HyperANF)...")
+    build_neighborhood("data/edges.csv", "data/neighborhood.csv", "data/hop_plot.csv")
+
+    print("\n STEP 10: Generating all visualizations...")
     generate_all_plots()
 
+    print("\n STEP 11: Exporting the interactive graph view...")
+    export_interactive("data/edges.csv", "data/communities.csv", "data/community_summary.csv", "data/graph_view")
+
     print("\n ALL TASKS COMPLETED SUCCESSFULLY ")
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Run the LinkedIn network pipeline.")
+    parser.add_argument("--full", action="store_true",
+                        help="re-clean and re-ingest every file instead of only the changed ones")
+    args = parser.parse_args()
+    main(full=args.full)
@@ -0,0 +1,268 @@
+import hashlib
+import json
+import os
+import pandas as pd
+from cleaner import clean_files, raw_files
+from degree_builder import save_degrees
+from graph_builder import save_edges
+from companies import company_table, save_company_table
+from ingest import connection_edges, ingest_file, ingest_jobs
+from naming import student_for
+from parallel import map_files
+
+MANIFEST_VERSION = 1
+
+
+# --- file signatures ---
+
+def file_signature(path, previous=None):
+    """
+    Size, mtime and SHA-1 of a file.
+    The hash is reused from `previous` when size and mtime are unchanged,
+    so unchanged files are never re-read.
+    """
+    st = os.stat(path)
+    if previous and previous.get("size") == st.st_size and previous.get("mtime_ns") == st.st_mtime_ns:
+        return {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha1": previous["sha1"]}
+
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha1": h.hexdigest()}
+
+
+def is_changed(path, entry):
+    """
+    True when the file is new, its content differs from the manifest entry,
+    or one of the outputs it produced has gone missing.
+    """
+    if not entry or not os.path.exists(path):
+        return True
+    if file_signature(path, entry)["sha1"] != entry["sha1"]:
+        return True
+    return any(not os.path.exists(out) for out in entry.get("outputs", []))
+
+
+def load_manifest(manifest_path="data/manifest.json"):
+    if not os.path.exists(manifest_path):
+        return {}
+    try:
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return manifest if manifest.get("version") == MANIFEST_VERSION else {}
+
+
+def save_manifest(manifest, manifest_path="data/manifest.json"):
+    manifest["version"] = MANIFEST_VERSION
+    tmp_path = manifest_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1)
+    os.replace(tmp_path, manifest_path)
+
+
+def _remove(path):
+    if os.path.exists(path):
+        os.remove(path)
+
+
+# --- incremental pipeline ---
+
+def update_raw(raw_dir, cleaned_folder, previous, workers=1, full=False):
+    """
+    Re-cleans only the raw exports that changed (every export with
+    full=True) and deletes the cleaned outputs of raw files that
+    disappeared. Returns the new "raw" section.
+    """
+    current = {}
+    changed = []
+
+    for path in raw_files(raw_dir):
+        entry = previous.get(path)
+        if full or is_changed(path, entry):
+            changed.append(path)
+        else:
+            current[path] = entry
+
+    for path, out_path in clean_files(changed, cleaned_folder, workers):
+        entry = file_signature(path)
+        entry["outputs"] = [out_path] if out_path else []
+        current[path] = entry
+
+    # outputs of removed files, and old outputs of re-cleaned ones (written
+    # before outputs were keyed by the file's stable ID), are stale
+    kept = {out for entry in current.values() for out in entry["outputs"]}
+    for path, entry in previous.items():
+        for out in entry.get("outputs", []):
+            if out not in kept:
+                _remove(out)
+
+    print(f" Raw files: {len(changed)} re-cleaned, {len(previous.keys() - current.keys())} removed, "
+          f"{len(current) - len(changed)} unchanged")
+    return current
+
+
+def update_ingest(cleaned_folder, adjacency_folder, connections_output, previous, workers=1, full=False):
+    """
+    Re-ingests the cleaned/adjacency files that changed (all of them with full=True).
+
+    Every file of an affected student is re-read (two files can map to the
+    same student name). Returns (new "inputs" section, affected students,
+    degree rows and edges of the affected students).
+    """
+    os.makedirs(adjacency_folder, exist_ok=True)
+    os.makedirs(connections_output, exist_ok=True)
+
+    # outputs of cleaned files that are gone are no longer valid
+    for file, entry in previous.items():
+        if entry["kind"] == "cleaned" and not os.path.exists(os.path.join(cleaned_folder, file)):
+            for out in entry["outputs"]:
+                _remove(out)
+
+    jobs = {os.path.basename(job[1]): job for job in ingest_jobs(cleaned_folder, adjacency_folder, connections_output)}
+
+    affected = {previous[f]["student"] for f in previous.keys() - jobs.keys()}
+    for file, job in jobs.items():
+        entry = previous.get(file)
+        if full or entry is None or entry["kind"] != job[0] or is_changed(job[1], entry):
+            affected.add(student_for(file))
+
+    current = {f: previous[f] for f in jobs if student_for(f) not in affected}
+    rerun = [job for f, job in jobs.items() if student_for(f) in affected]
+
+    degree_data = []
+    edges = []
+
+    for job, (student, connections, companies, message) in zip(rerun, map_files(ingest_file, rerun, workers)):
+        print(message)
+        kind, inp_path, adjacency_out, connections_out = job
+        outputs = [connections_out] + ([adjacency_out] if kind == "cleaned" else [])
+
+        entry = file_signature(inp_path)
+        entry.update({"kind": kind, "student": student, "outputs": outputs, "degree": None, "companies": {}})
+
+        if connections is not None:
+            entry["degree"] = len(connections)
+            degree_data.append((student, len(connections)))
+            edges.extend(connection_edges(student, connections))
+            if companies is not None:
+                entry["companies"] = {("" if pd.isna(c) else str(c)): int(n) for c, n in companies.items()}
+
+        current[os.path.basename(inp_path)] = entry
+
+    print(f" Connection files: {len(rerun)} re-ingested, {len(current) - len(rerun)} unchanged")
+    return current, affected, degree_data, edges
+
+
+def patch_outputs(affected, degree_data, edges, inputs, degree_output, edges_output, companies_output, full):
+    """
+    Replaces the rows of the affected students in degree.csv and edges.csv
+    instead of regenerating them, and rebuilds the company table from the
+    per-file counts kept in the manifest.
+    """
+    if not full and os.path.exists(degree_output):
+        old = pd.read_csv(degree_output, dtype={"Student": str}, keep_default_na=False)
+        old = old[~old["Student"].isin(affected)]
+        degree_data = list(old.itertuples(index=False, name=None)) + degree_data
+    save_degrees(degree_data, degree_output)
+
+    new_edges = pd.DataFrame(edges, columns=["Source", "Target"])
+    if not full and os.path.exists(edges_output):
+        old = pd.read_csv(edges_output, dtype=str, keep_default_na=False)
+        old = old[~old["Source"].isin(affected)]
+        new_edges = pd.concat([old, new_edges], ignore_index=True)
+    save_edges(new_edges, edges_output)
+
+    parts = []
+    for entry in inputs.values():
+        counts = pd.Series(entry["companies"], dtype="int64")
+        counts.index = counts.index.map(lambda c: c if c else float("nan"))
+        parts.append((entry["student"], counts))
+    save_company_table(company_table(parts), companies_output)
+
+
+def ingest_all(cleaned_folder="data/cleaned",
+               adjacency_folder="data/adjacency",
+               degree_output="data/degree.csv",
+               connections_output="data/connected_to",
+               edges_output="data/edges.csv",
+               companies_output="data/company_table.csv",
+               workers=1):
+    """
+    Fused ingestion: reads every cleaned file exactly once and produces the
+    adjacency lists, connected_to copies, degree.csv, edges.csv (+ snapshot)
+    and the company table (per-student company counts) — the same files as
+    build_adjacency, build_degrees and build_graph run one after another.
+
+    Adjacency files that have no cleaned source are still read (once), so the
+    degree and edge outputs cover the whole adjacency folder as before.
+    Same outputs as update_pipeline(full=True) without the raw cleaning
+    step and without a manifest.
+    """
+    os.makedirs(adjacency_folder, exist_ok=True)
+    os.makedirs(connections_output, exist_ok=True)
+
+    jobs = ingest_jobs(cleaned_folder, adjacency_folder, connections_output)
+
+    degree_data = []
+    edges = []
+    company_parts = []
+
+    for student, connections, companies, message in map_files(ingest_file, jobs, workers):
+        print(message)
+        if connections is None:
+            continue
+
+        degree_data.append((student, len(connections)))
+        edges.extend(connection_edges(student, connections))
+        if companies is not None:
+            company_parts.append((student, companies))
+
+    save_degrees(degree_data, degree_output)
+    print(f" Connected lists saved → {connections_output}")
+
+    save_edges(edges, edges_output)
+
+    save_company_table(company_table(company_parts), companies_output)
+
+
+def update_pipeline(raw_dir,
+                    cleaned_folder="data/cleaned",
+                    adjacency_folder="data/adjacency",
+                    degree_output="data/degree.csv",
+                    connections_output="data/connected_to",
+                    edges_output="data/edges.csv",
+                    companies_output="data/company_table.csv",
+                    manifest_path="data/manifest.json",
+                    workers=1,
+                    full=False):
+    """
+    Incremental clean + ingest driven by the manifest.
+
+    Only raw files whose content changed are re-cleaned, only changed cleaned
+    and adjacency files are re-ingested, and degree.csv / edges.csv are
+    patched for the affected students. full=True (or a missing manifest)
+    re-cleans and re-ingests everything; the previous manifest is still
+    used to delete the outputs of files that are gone.
+
+    Only the per-file steps are incremental: edges.csv is rewritten as a
+    whole, so the graph snapshot (and everything computed from it) is
+    rebuilt whenever any student changed.
+    """
+    manifest = load_manifest(manifest_path)
+    full = full or not manifest
+
+    raw = update_raw(raw_dir, cleaned_folder, manifest.get("raw", {}), workers, full)
+    inputs, affected, degree_data, edges = update_ingest(
+        cleaned_folder, adjacency_folder, connections_output, manifest.get("inputs", {}), workers, full)
+
+    if affected or full:
+        patch_outputs(affected, degree_data, edges, inputs,
+                      degree_output, edges_output, companies_output, full)
+    else:
+        print(" Degree, edge and company files are up to date.")
+
+    save_manifest({"raw": raw, "inputs": inputs}, manifest_path)
+    print(f" Manifest saved → {manifest_path}")
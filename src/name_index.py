@@ -0,0 +1,221 @@
+import argparse
+import bisect
+import difflib
+import os
+import re
+import unicodedata
+from collections import defaultdict
+import numpy as np
+import pandas as pd
+from graph_store import NodeNotFound, get_graph_store
+
+
+def normalize(name):
+    """
+    Lookup key for a person name: accents stripped, lower case, punctuation
+    dropped, runs of whitespace collapsed ("A   K M" -> "a k m").
+    """
+    text = unicodedata.normalize("NFKD", str(name))
+    text = text.encode("ascii", "ignore").decode("ascii").lower()
+    return " ".join(re.sub(r"[^a-z0-9]+", " ", text).split())
+
+
+def trigram_codes(key):
+    """Character trigrams of " key " packed into int64 codes."""
+    padded = f" {key} "
+    return {(ord(padded[i]) << 16) | (ord(padded[i + 1]) << 8) | ord(padded[i + 2])
+            for i in range(len(padded) - 2)}
+
+
+def load_aliases(store, aliases_file):
+    """
+    Groups of node IDs that are the same person, from a hand-maintained
+    Name,Canonical CSV (one row per alternative spelling). Rows naming
+    people that are not in the graph are ignored. Returns {node ID: group}.
+    """
+    groups = {}
+    if not aliases_file or not os.path.exists(aliases_file):
+        return groups
+
+    aliases = pd.read_csv(aliases_file, dtype=str, keep_default_na=False, encoding="utf-8-sig")
+    members = defaultdict(set)
+    for name, canonical in zip(aliases["Name"], aliases["Canonical"]):
+        if name in store and canonical in store:
+            members[canonical].update((store.node_id(name), store.node_id(canonical)))
+    for group in members.values():
+        for node in group:
+            groups[node] = group
+    return groups
+
+
+class NameIndex:
+    """
+    Name resolution over the node names of a GraphStore.
+
+    keys       normalised key -> node IDs (hash map, exact after normalising)
+    sorted     sorted (key, id) list; a range of it is every key with a given
+               prefix, so it serves as a compact trie for completion
+    trigrams   trigram code -> IDs as sorted NumPy posting lists, built on
+               first use, for fuzzy "did you mean" lookups
+    groups     node ID -> IDs of the same person, from name_aliases.csv
+               (see load_aliases)
+    """
+
+    def __init__(self, store, aliases_file=None):
+        self.store = store
+        n = store.number_of_nodes()
+        self.normalized = [normalize(store.name(i)) for i in range(n)]
+        self.degrees = store.out_degrees() + store.in_degrees()
+
+        self.keys = defaultdict(list)
+        for node, key in enumerate(self.normalized):
+            self.keys[key].append(node)
+
+        self.sorted = sorted(zip(self.normalized, range(n)))
+        self._trigrams = None
+
+        self.groups = load_aliases(store, aliases_file)
+
+    # --- exact and normalised lookups ---
+
+    def resolve(self, name):
+        """
+        Node ID for `name`: exact match first, then the normalised key (the
+        best-connected node when several share it). Raises NodeNotFound with
+        suggestions otherwise.
+        """
+        try:
+            return self.store.node_id(name)
+        except NodeNotFound:
+            pass
+
+        nodes = self.keys.get(normalize(name))
+        if nodes:
+            return max(nodes, key=lambda i: (self.degrees[i], -i))
+
+        suggestions = self.suggest(name)
+        message = f"Node {str(name).strip()} is not in the graph"
+        if suggestions:
+            message += f". Did you mean: {', '.join(suggestions)}?"
+        raise NodeNotFound(message, suggestions)
+
+    def same_person(self, node):
+        """IDs of every node merged with `node` by the dedup pass (at least the node itself)."""
+        return self.groups.get(node, {node})
+
+    def resolve_name(self, name):
+        """Like resolve, but returns the graph's spelling of the name."""
+        return self.store.name(self.resolve(name))
+
+    def complete(self, prefix, k=10):
+        """Up to k names whose normalised key starts with `prefix`, best connected first."""
+        key = normalize(prefix)
+        start = bisect.bisect_left(self.sorted, (key, -1))
+        matches = []
+        for other, node in self.sorted[start:]:
+            if not other.startswith(key):
+                break
+            matches.append(node)
+        matches.sort(key=lambda i: (-self.degrees[i], i))
+        return [self.store.name(i) for i in matches[:k]]
+
+    # --- fuzzy lookups ---
+
+    def trigrams(self):
+        """(codes, offsets, ids): CSR posting lists of the trigram index."""
+        if self._trigrams is None:
+            codes, ids = [], []
+            for node, key in enumerate(self.normalized):
+                grams = trigram_codes(key)
+                codes.extend(grams)
+                ids.extend([node] * len(grams))
+            codes, ids = np.asarray(codes, dtype=np.int64), np.asarray(ids, dtype=np.int64)
+            order = np.lexsort((ids, codes))
+            codes, ids = codes[order], ids[order]
+            unique, starts = np.unique(codes, return_index=True)
+            offsets = np.append(starts, len(codes))
+            self._trigrams = (unique, offsets, ids)
+        return self._trigrams
+
+    def suggest(self, name, k=5, candidates=50, cutoff=0.6):
+        """
+        "Did you mean" names for `name`: candidates sharing the most trigrams
+        (Dice similarity over the posting lists), re-ranked by edit similarity.
+        """
+        key = normalize(name)
+        grams = np.fromiter(trigram_codes(key), dtype=np.int64)
+        if not key or not len(grams):
+            return []
+
+        unique, offsets, ids = self.trigrams()
+        pos = np.searchsorted(unique, grams)
+        pos = pos[(pos < len(unique)) & (unique[np.minimum(pos, len(unique) - 1)] == grams)]
+        if not len(pos):
+            return []
+
+        hits = np.concatenate([ids[offsets[p]:offsets[p + 1]] for p in pos])
+        nodes, shared = np.unique(hits, return_counts=True)
+        sizes = np.array([max(len(self.normalized[i]), 1) for i in nodes])  # trigrams of a padded key
+        dice = 2.0 * shared / (len(grams) + sizes)
+        best = nodes[np.argsort(-dice, kind="stable")[:candidates]]
+
+        scored = []
+        for node in best.tolist():
+            ratio = difflib.SequenceMatcher(None, key, self.normalized[node]).ratio()
+            if ratio >= cutoff:
+                scored.append((-ratio, -self.degrees[node], node))
+        scored.sort()
+
+        names, seen = [], set()
+        for _, _, node in scored:
+            if self.normalized[node] not in seen:
+                seen.add(self.normalized[node])
+                names.append(self.store.name(node))
+            if len(names) == k:
+                break
+        return names
+
+
+_INDEX_CACHE = {}
+
+
+def get_name_index(edge_file="data/edges.csv", aliases_file=None):
+    """
+    Cached NameIndex for the current graph store of edge_file; aliases come
+    from name_aliases.csv next to it unless `aliases_file` is given.
+    """
+    if aliases_file is None:
+        aliases_file = os.path.join(os.path.dirname(edge_file), "name_aliases.csv")
+    store = get_graph_store(edge_file)
+    key = os.path.abspath(edge_file)
+    cached = _INDEX_CACHE.get(key)
+    if cached is None or cached.store is not store:
+        cached = NameIndex(store, aliases_file)
+        _INDEX_CACHE[key] = cached
+    return cached
+
+
+def resolve_node(edge_file, name):
+    """
+    Node ID for `name` in the graph of edge_file. An exact name is a binary
+    search on the store; the NameIndex is built (and cached) only when that
+    misses. Raises NodeNotFound with suggestions.
+    """
+    try:
+        return get_graph_store(edge_file).node_id(name)
+    except NodeNotFound:
+        return get_name_index(edge_file).resolve(name)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Resolve a name and show similar names.")
+    parser.add_argument("name", help="resolve a name and show suggestions")
+    parser.add_argument("--edges", default="data/edges.csv")
+    args = parser.parse_args()
+
+    index = get_name_index(args.edges)
+    try:
+        print(f" {args.name!r} -> {index.resolve_name(args.name)!r}")
+    except NodeNotFound as e:
+        print(f" {e}")
+    print(" Similar names:", ", ".join(index.suggest(args.name)) or "none")
@@ -0,0 +1,40 @@
+import hashlib
+import os
+import re
+
+ID_SEPARATOR = "--"
+ID_PATTERN = re.compile(ID_SEPARATOR + r"[0-9a-f]{8}$")
+# words LinkedIn (or the student) puts in an export's file name that are not part of the name
+EXPORT_WORDS = {"connections", "connection", "linkedin", "export"}
+
+
+def file_id(file_path):
+    """
+    Stable 8-hex-digit ID of a raw export: a hash of its file name, so it is
+    the same on every run and every machine and differs between exports.
+    """
+    return hashlib.sha1(os.path.basename(file_path).encode("utf-8")).hexdigest()[:8]
+
+
+def output_name(file_path):
+    """
+    Cleaned output name of a raw export: the student name from the file
+    name, plus the export's stable ID ("Aman_Singh--1a2b3c4d.csv"), so two
+    exports of the same name never overwrite each other.
+    The name keeps every word of the file name ("A D S David Babu.csv" ->
+    "A_D_S_David_Babu"), so students who only share their first words stay
+    separate nodes. Digits, punctuation and export words are dropped
+    ("Aman Singh Connections (1).csv" -> "Aman_Singh").
+    """
+    stem = os.path.splitext(os.path.basename(file_path))[0]
+    words = [w for w in re.findall(r"[^\W\d_]+", stem) if w.lower() not in EXPORT_WORDS]
+    if words:
+        stem = "_".join(words)
+
+    return f"{stem}{ID_SEPARATOR}{file_id(file_path)}.csv"
+
+
+def student_for(file):
+    """Student name of a cleaned/adjacency file name or stem (the stable ID is dropped)."""
+    stem = file.replace(".csv", "")
+    return ID_PATTERN.sub("", stem).replace("_", " ").strip()
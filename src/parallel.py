@@ -0,0 +1,23 @@
+from concurrent.futures import ProcessPoolExecutor
+
+
+def map_files(func, items, workers=1, chunksize=None):
+    """
+    Applies `func` to every item and yields the results in input order.
+
+    workers <= 1 runs serially in this process; otherwise the items are fanned
+    out to a process pool. `func` must be a module-level function so it can be
+    pickled.
+    """
+    items = list(items)
+
+    if not workers or workers <= 1 or len(items) <= 1:
+        for item in items:
+            yield func(item)
+        return
+
+    if chunksize is None:
+        chunksize = max(1, len(items) // (workers * 8))
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(func, items, chunksize=chunksize)
@@ -1,47 +1,211 @@
+import argparse
+import time
 import pandas as pd
-import networkx as nx
-import sys
+from graph_store import NodeNotFound, edge_columns, get_graph_store, load_graph_store
+from introductions import find_introducers
+from landmarks import estimate_batch, estimate_separation
+from name_index import resolve_node
+from parallel import map_files
+
 
 def load_graph(edge_file="data/edges.csv"):
-    df = pd.read_csv(edge_file)
+    """
+    Returns a networkx DiGraph view of edges.csv.
+    Path search itself runs on the compact GraphStore; use this only when
+    networkx algorithms are needed.
+    """
+    return load_graph_store(edge_file).to_networkx()
 
-    # Handle both
-    if "Source" in df.columns and "Target" in df.columns:
-        src, tgt = "Source", "Target"
-    elif "A" in df.columns and "B" in df.columns:
-        src, tgt = "A", "B"
-    else:
-        raise ValueError("Unknown edge columns in edges.csv")
 
-    G = nx.DiGraph()   # directed graph
-    for _, row in df.iterrows():
-        G.add_edge(row[src], row[tgt])
-    return G
+def networkx_path(store, student1, student2, undirected=False):
+    """
+    Reference search with nx.shortest_path, timed, for comparison.
+    Returns (path or None, seconds); graph construction is not timed.
+    """
+    import networkx as nx
+
+    G = store.to_networkx()
+    if undirected:
+        G = G.to_undirected(as_view=True)
+
+    started = time.perf_counter()
+    try:
+        path = nx.shortest_path(G, source=student1, target=student2)
+    except nx.NetworkXNoPath:
+        path = None
+    return path, time.perf_counter() - started
 
 
-def find_path(student1, student2, edge_file="data/edges.csv"):
-    G = load_graph(edge_file)
+def find_path(student1, student2, edge_file="data/edges.csv", undirected=False, stats=False, compare=False):
+    """
+    Prints and returns the shortest path between two students.
+    undirected=True treats connections as symmetric; stats prints the number
+    of expanded nodes and the search time; compare also times networkx.
+    """
+    store = get_graph_store(edge_file)
 
     print("\nSearching path between:")
     print("-->", student1)
     print("-->", student2)
 
     try:
-        path = nx.shortest_path(G, source=student1, target=student2)
-        print("\n Shortest Path Found:\n")
-        print(" --> ".join(path))
-        return path
+        # tolerate case / spacing differences; unknown names get suggestions
+        student1, student2 = (store.name(resolve_node(edge_file, s)) for s in (student1, student2))
+    except NodeNotFound as e:
+        print(f"\n Error: {e}")
+        return None
 
-    except nx.NetworkXNoPath:
+    result = store.search(student1, student2, undirected=undirected)
+
+    if stats or compare:
+        print(f"\n Bidirectional BFS: {result.expanded} nodes expanded in {result.seconds * 1000:.2f} ms")
+    if compare:
+        nx_path, nx_seconds = networkx_path(store, student1, student2, undirected)
+        nx_len = len(nx_path) - 1 if nx_path else None
+        print(f" networkx shortest_path: {nx_seconds * 1000:.2f} ms (length {nx_len})")
+
+    path = result.path
+    if path is None:
         print("\n No path exists between these students.")
-    except nx.NodeNotFound as e:
-        print(f"\n Error: {e}")
+        return None
+
+    print("\n Shortest Path Found:\n")
+    print(" --> ".join(path))
+    return path
+
+
+def paths_for_source(job):
+    """
+    Answers every pair that shares one source node.
+    `job` is (edge_file, source ID, [(row, target ID), ...], undirected).
+    A single distinct target uses bidirectional search; several reuse one
+    BFS tree. Pairs in different components are answered from the
+    component index. Returns a list of (row, distance, path, status).
+    """
+    edge_file, s, targets, undirected = job
+    store = get_graph_store(edge_file)
+    several = len({t for _, t in targets}) > 1
+    parent = None
+    paths = {}
+    rows = []
+
+    for row, t in targets:
+        if t not in paths:
+            # the component index rejects unreachable pairs without searching
+            if not store.may_reach(s, t, undirected):
+                paths[t] = None
+            elif several:
+                if parent is None:
+                    parent, _ = store.bfs(s, undirected=undirected)
+                paths[t] = store.tree_path(parent, t)
+            else:
+                paths[t] = store.search(store.name(s), store.name(t), undirected=undirected).path
+
+        path = paths[t]
+        if path is None:
+            rows.append((row, None, None, "no path"))
+        else:
+            rows.append((row, len(path) - 1, " --> ".join(path), "ok"))
+
+    return rows
+
+
+def find_paths_batch(pairs_file, output_file="data/path_results.csv", edge_file="data/edges.csv",
+                     undirected=False, workers=1):
+    """
+    Shortest paths for every (source, target) pair in pairs_file.
+    Names are resolved to nodes first (so spelling variants of one person
+    share a search) and pairs are grouped by source node, so each source is
+    searched once; sources are spread over worker processes, which share
+    the memory-mapped snapshot. Writes Source, Target, Distance, Path,
+    Status rows to output_file, in input order.
+    """
+    # builds / refreshes the snapshot once, before the workers map it
+    get_graph_store(edge_file)
+
+    pairs = pd.read_csv(pairs_file, dtype=str, keep_default_na=False)
+    src, tgt = edge_columns(pairs)
+    pairs = pairs[[src, tgt]].apply(lambda col: col.str.strip())
+    sources, targets = pairs[src].tolist(), pairs[tgt].tolist()
+
+    ids = {}
+    for name in set(sources) | set(targets):
+        try:
+            ids[name] = resolve_node(edge_file, name)
+        except NodeNotFound:
+            ids[name] = None
+
+    answers = {}
+    groups = {}
+    for row, (source, target) in enumerate(zip(sources, targets)):
+        s, t = ids[source], ids[target]
+        if s is None:
+            answers[row] = (None, None, "source not found")
+        elif t is None:
+            answers[row] = (None, None, "target not found")
+        else:
+            groups.setdefault(s, []).append((row, t))
+    jobs = [(edge_file, s, group, undirected) for s, group in groups.items()]
+
+    started = time.perf_counter()
+    for source_rows in map_files(paths_for_source, jobs, workers):
+        for row, distance, path, status in source_rows:
+            answers[row] = (distance, path, status)
+
+    rows = [(source, target, *answers[row]) for row, (source, target) in enumerate(zip(sources, targets))]
+    results = pd.DataFrame(rows, columns=["Source", "Target", "Distance", "Path", "Status"])
+    results["Distance"] = results["Distance"].astype("Int64")
+    results.to_csv(output_file, index=False, encoding="utf-8-sig")
+
+    found = int((results["Status"] == "ok").sum())
+    print(f"\n Answered {len(results)} pairs ({found} with a path) from {len(jobs)} sources "
+          f"in {time.perf_counter() - started:.2f} s")
+    print(f" Results saved → {output_file}")
+    return results
 
 
 if __name__ == "__main__":
-    if len(sys.argv) != 3:
-        print("Usage: python src/path_finder.py \"Student A\" \"Student B\"")
+    parser = argparse.ArgumentParser(description="Find the shortest connection path between two students.",
+                                     usage="python src/path_finder.py \"Student A\" \"Student B\" [options]\n"
+                                           "       python src/path_finder.py --batch pairs.csv [options]")
+    parser.add_argument("student1", nargs="?")
+    parser.add_argument("student2", nargs="?")
+    parser.add_argument("--batch", metavar="PAIRS_CSV", help="CSV of (source, target) pairs to answer in one run")
+    parser.add_argument("--output", help="result file for --batch (default: data/path_results.csv, "
+                                         "or data/separation_estimates.csv with --approx)")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes for --batch")
+    parser.add_argument("--introducers", type=int, metavar="K",
+                        help="list the top K people who can introduce Student A to Student B (or --company)")
+    parser.add_argument("--company", help="with --introducers: target a company instead of Student B")
+    parser.add_argument("--edges", default="data/edges.csv", help="edge list (default: data/edges.csv)")
+    parser.add_argument("--undirected", action="store_true", help="treat connections as symmetric")
+    parser.add_argument("--approx", action="store_true",
+                        help="fast mode: distance bounds from the landmark oracle instead of an exact path")
+    parser.add_argument("--landmarks", type=int, default=16, metavar="K", help="landmarks for --approx")
+    parser.add_argument("--stats", action="store_true", help="report expanded nodes and search time")
+    parser.add_argument("--compare", action="store_true", help="also time networkx shortest_path")
+    args = parser.parse_args()
+
+    if args.batch and args.approx:
+        estimate_batch(args.batch, args.output or "data/separation_estimates.csv", args.edges,
+                       undirected=args.undirected, k=args.landmarks, workers=args.workers)
+    elif args.batch:
+        find_paths_batch(args.batch, args.output or "data/path_results.csv", args.edges,
+                         undirected=args.undirected, workers=args.workers)
+    elif args.introducers and args.student1 and (args.student2 or args.company):
+        try:
+            find_introducers(args.student1, target=args.student2, company=args.company,
+                             k=args.introducers, edge_file=args.edges)
+        except NodeNotFound as e:
+            print(f"\n Error: {e}")
+    elif not (args.student1 and args.student2):
+        parser.error("give two student names or --batch PAIRS_CSV")
+    elif args.approx:
+        try:
+            estimate_separation(args.student1, args.student2, args.edges,
+                                undirected=args.undirected, k=args.landmarks, workers=args.workers)
+        except NodeNotFound as e:
+            print(f"\n Error: {e}")
     else:
-        student1 = sys.argv[1]
-        student2 = sys.argv[2]
-        find_path(student1, student2)
+        find_path(args.student1, args.student2, args.edges,
+                  undirected=args.undirected, stats=args.stats, compare=args.compare)
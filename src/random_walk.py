@@ -0,0 +1,159 @@
+import argparse
+from collections import namedtuple
+import numpy as np
+from graph_store import NodeNotFound, get_graph_store
+from name_index import resolve_node
+
+WalkResult = namedtuple("WalkResult", ["walk_lengths", "pruned_lengths", "walk"])
+
+
+def walk_batch(store, start, end, walkers, max_steps=1000, rng=None):
+    """
+    Advances `walkers` random walks from node `start` at once over the CSR arrays.
+
+    Every step picks a uniformly random successor for all still-active
+    walkers; a walker stops when it reaches `end` or hits a dead end.
+    Returns (history, lengths): history[step, w] is the node of walker w
+    after `step` moves, lengths[w] is the number of nodes on its walk, or -1
+    when it never reached `end`.
+    """
+    rng = rng or np.random.default_rng()
+    history = np.full((max_steps + 1, walkers), -1, dtype=np.int32)
+    history[0] = start
+    lengths = np.full(walkers, -1, dtype=np.int64)
+
+    if start == end:
+        lengths[:] = 1
+        return history, lengths
+
+    current = np.full(walkers, start, dtype=np.int64)
+    active = np.arange(walkers)
+
+    for step in range(1, max_steps + 1):
+        if not len(active):
+            break
+
+        nodes = current[active]
+        starts = store.offsets[nodes]
+        degrees = store.offsets[nodes + 1] - starts
+
+        alive = degrees > 0  # dead ends stop the walk, as in the notebook
+        active, starts, degrees = active[alive], starts[alive], degrees[alive]
+
+        picks = (rng.random(len(active)) * degrees).astype(np.int64)
+        nxt = store.neighbors[starts + picks]
+        current[active] = nxt
+        history[step, active] = nxt
+
+        hit = nxt == end
+        lengths[active[hit]] = step + 1
+        active = active[~hit]
+
+    return history, lengths
+
+
+def prune_walk(walk):
+    """
+    Loop-erases a walk: whenever a node is revisited, the cycle since its
+    first visit is cut out, leaving a simple path from start to end.
+    """
+    path = []
+    position = {}
+    for node in walk:
+        if node in position:
+            cut = position[node] + 1
+            for removed in path[cut:]:
+                del position[removed]
+            del path[cut:]
+        else:
+            position[node] = len(path)
+            path.append(node)
+    return path
+
+
+def try_random_walks(store, start, end, attempts=100, max_steps=1000, seed=None, batch_size=4096):
+    """
+    Runs `attempts` random walks from `start` to `end`, batch_size walkers at a time.
+    Returns WalkResult(walk_lengths, pruned_lengths, walk) for the successful
+    walks; `walk` is the first successful walk as a list of names (or None).
+    """
+    s, t = store.node_id(start), store.node_id(end)
+    rng = np.random.default_rng(seed)
+
+    walk_lengths = []
+    pruned_lengths = []
+    first_walk = None
+
+    remaining = attempts
+    while remaining > 0:
+        walkers = min(batch_size, remaining)
+        remaining -= walkers
+
+        history, lengths = walk_batch(store, s, t, walkers, max_steps, rng)
+        for w in np.flatnonzero(lengths > 0):
+            walk = history[:lengths[w], w].tolist()
+            walk_lengths.append(len(walk))
+            pruned_lengths.append(len(prune_walk(walk)))
+            if first_walk is None:
+                first_walk = [store.name(i) for i in walk]
+
+    return WalkResult(walk_lengths, pruned_lengths, first_walk)
+
+
+def compute_stats(lengths):
+    if not lengths:
+        return {"mean": None, "median": None, "std": None}
+
+    return {
+        "mean": round(np.mean(lengths), 2),
+        "median": round(np.median(lengths), 2),
+        "std": round(np.std(lengths), 2)
+    }
+
+
+def random_walk_report(start_student, end_student, edge_file="data/edges.csv",
+                       attempts=100, max_steps=1000, seed=None):
+    """
+    Prints random-walk and pruned-path statistics between two students.
+    Names are matched like in path_finder (case / spacing tolerant); unknown
+    names raise NodeNotFound with suggestions.
+    """
+    store = get_graph_store(edge_file)
+    start_student, end_student = (store.name(resolve_node(edge_file, s)) for s in (start_student, end_student))
+    result = try_random_walks(store, start_student, end_student, attempts, max_steps, seed)
+
+    walk_stats = compute_stats(result.walk_lengths)
+    pruned_stats = compute_stats(result.pruned_lengths)
+
+    print(f" Random Walk Stats between '{start_student}' and '{end_student}':")
+    print(f"  - Successful Walks: {len(result.walk_lengths)} / {attempts}")
+    print("  - Mean Length:", walk_stats["mean"])
+    print("  - Median Length:", walk_stats["median"])
+    print("  - Std Deviation:", walk_stats["std"])
+
+    print(f"\n Pruned Path Stats:")
+    print("  - Mean Length:", pruned_stats["mean"])
+    print("  - Median Length:", pruned_stats["median"])
+    print("  - Std Deviation:", pruned_stats["std"])
+
+    if result.walk:
+        print("\n First successful walk:\n")
+        print(" --> ".join(result.walk))
+
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Monte Carlo random walks between two students.")
+    parser.add_argument("start")
+    parser.add_argument("end")
+    parser.add_argument("--edges", default="data/edges.csv")
+    parser.add_argument("--attempts", type=int, default=100)
+    parser.add_argument("--max-steps", type=int, default=1000)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    try:
+        random_walk_report(args.start, args.end, args.edges, args.attempts, args.max_steps, args.seed)
+    except NodeNotFound as e:
+        print(f"\n Error: {e}")
@@ -0,0 +1,287 @@
+import argparse
+import json
+import os
+import socketserver
+import threading
+import time
+import traceback
+from collections import OrderedDict, namedtuple
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+import numpy as np
+from graph_store import NodeNotFound, get_graph_store
+from name_index import get_name_index
+
+
+class LRUCache:
+    """Small thread-safe LRU cache for query results."""
+
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self.data = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self.lock:
+            if key in self.data:
+                self.data.move_to_end(key)
+                self.hits += 1
+                return self.data[key]
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        with self.lock:
+            self.data[key] = value
+            self.data.move_to_end(key)
+            while len(self.data) > self.maxsize:
+                self.data.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.data.clear()
+
+
+# One loaded graph: the store, its name index and the cache of results computed on it.
+# Swapped as a whole on reload, so a request never mixes two versions of the graph.
+GraphState = namedtuple("GraphState", ["store", "index", "cache", "loaded_at"])
+
+
+class GraphService:
+    """
+    Holds the graph in memory and answers queries.
+    edges.csv is checked at most every `check_interval` seconds; when it
+    changed on disk the graph is reloaded with a fresh result cache.
+    The check and reload run on a background thread: requests keep being
+    answered from the current state until the new one is complete.
+    """
+
+    def __init__(self, edge_file="data/edges.csv", cache_size=4096, check_interval=2.0):
+        self.edge_file = edge_file
+        self.cache_size = cache_size
+        self.check_interval = check_interval
+        self.reload_lock = threading.Lock()
+        self.checked_at = 0.0
+        self.state = None
+        self.reload()
+
+    def reload(self):
+        """Loads edges.csv if it changed and swaps in the new state (blocking)."""
+        with self.reload_lock:
+            self._load()
+
+    def _load(self):
+        store = get_graph_store(self.edge_file)
+        if self.state is None or store is not self.state.store:
+            index = get_name_index(self.edge_file)
+            self.state = GraphState(store, index, LRUCache(self.cache_size), time.time())
+            print(f" Graph loaded: {store.number_of_nodes()} nodes, {store.number_of_edges()} edges")
+        self.checked_at = time.time()
+
+    def _background_reload(self):
+        try:
+            self._load()
+        except Exception:
+            # keep serving the current graph; the next check tries again
+            traceback.print_exc()
+            self.checked_at = time.time()
+        finally:
+            self.reload_lock.release()
+
+    def current_state(self):
+        """The current state; starts a background reload when a check is due and none is running."""
+        if time.time() - self.checked_at > self.check_interval and self.reload_lock.acquire(blocking=False):
+            threading.Thread(target=self._background_reload, daemon=True).start()
+        return self.state
+
+    # --- queries ---
+
+    def query(self, kind, params):
+        state = self.current_state()
+        handler = {
+            "path": self.path,
+            "degree": self.degree,
+            "neighbors": self.neighbors,
+            "stats": self.stats,
+            "suggest": self.suggest,
+        }.get(kind)
+        if handler is None:
+            raise ValueError(f"Unknown query: {kind}")
+        if kind == "stats":
+            # cheap, and includes live cache counters
+            return handler(state, params)
+
+        key = (kind, tuple(sorted(params.items())))
+        result = state.cache.get(key)
+        if result is None:
+            result = handler(state, params)
+            state.cache.put(key, result)
+        return result
+
+    def path(self, state, params):
+        undirected = params.get("undirected", "0").lower() in ("1", "true", "yes")
+        source, target = state.index.resolve_name(params["source"]), state.index.resolve_name(params["target"])
+        result = state.store.search(source, target, undirected=undirected)
+        return {
+            "source": params["source"],
+            "target": params["target"],
+            "path": result.path,
+            "distance": len(result.path) - 1 if result.path else None,
+            "expanded": result.expanded,
+            "search_ms": round(result.seconds * 1000, 3),
+        }
+
+    def degree(self, state, params):
+        store = state.store
+        node = state.index.resolve(params["name"])
+        out_degree = int(store.offsets[node + 1] - store.offsets[node])
+        in_degree = int(store.rev_offsets[node + 1] - store.rev_offsets[node])
+        return {"name": store.name(node), "out_degree": out_degree, "in_degree": in_degree}
+
+    def neighbors(self, state, params):
+        store = state.store
+        node = state.index.resolve(params["name"])
+        direction = params.get("direction", "out")
+        if direction not in ("out", "in", "both"):
+            raise ValueError("direction must be one of out/in/both")
+        limit = int(params.get("limit", 100))
+
+        ids = {
+            "out": store.successors(node),
+            "in": store.predecessors(node),
+            "both": np.union1d(store.successors(node), store.predecessors(node)),
+        }[direction]
+        return {
+            "name": store.name(node),
+            "direction": direction,
+            "count": int(len(ids)),
+            "neighbors": [store.name(int(i)) for i in ids[:limit]],
+        }
+
+    def suggest(self, state, params):
+        """Name completions for a prefix plus fuzzy "did you mean" matches."""
+        limit = int(params.get("limit", 10))
+        return {
+            "name": params["name"],
+            "completions": state.index.complete(params["name"], limit),
+            "similar": state.index.suggest(params["name"], limit),
+        }
+
+    def stats(self, state, params):
+        store, cache = state.store, state.cache
+        out_degrees = store.out_degrees()
+        top = int(out_degrees.argmax()) if len(out_degrees) else None
+        return {
+            "nodes": store.number_of_nodes(),
+            "edges": store.number_of_edges(),
+            "density": store.density(),
+            "students": int(np.count_nonzero(out_degrees)),
+            "max_degree": int(out_degrees.max()) if len(out_degrees) else 0,
+            "most_connected": store.name(top) if top is not None else None,
+            "loaded_at": state.loaded_at,
+            "cache": {"size": len(cache.data), "hits": cache.hits, "misses": cache.misses},
+        }
+
+
+class QueryHandler(BaseHTTPRequestHandler):
+    """
+    GET /<query>?param=value  or  POST /<query> with a JSON object body.
+    Queries: path (source, target, undirected), degree (name),
+    neighbors (name, direction, limit), suggest (name, limit), stats.
+    """
+
+    service = None
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        self.answer(url.path.strip("/"), params)
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self.send_json(400, {"error": "Body must be a JSON object"})
+            return
+        if not isinstance(body, dict):
+            self.send_json(400, {"error": "Body must be a JSON object"})
+            return
+        self.answer(url.path.strip("/"), {k: str(v) for k, v in body.items()})
+
+    def answer(self, kind, params):
+        started = time.perf_counter()
+        try:
+            result = self.service.query(kind, params)
+        except NodeNotFound as e:
+            self.send_json(404, {"error": str(e), "suggestions": e.suggestions})
+            return
+        except KeyError as e:
+            self.send_json(400, {"error": f"Missing parameter: {e}"})
+            return
+        except ValueError as e:
+            self.send_json(400, {"error": str(e)})
+            return
+        except Exception as e:
+            # keep the connection answered; the traceback goes to the server log
+            self.log_error("Query %s failed: %r", kind, e)
+            traceback.print_exc()
+            self.send_json(500, {"error": "Internal server error"})
+            return
+
+        result = dict(result, latency_ms=round((time.perf_counter() - started) * 1000, 3))
+        self.send_json(200, result)
+
+    def send_json(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def address_string(self):
+        # Unix socket clients have no (host, port) address
+        return self.client_address[0] if self.client_address else "unix"
+
+
+class ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def serve(edge_file="data/edges.csv", host="127.0.0.1", port=8765, unix_socket=None, cache_size=4096):
+    """
+    Loads the graph once and serves JSON queries until interrupted.
+    """
+    QueryHandler.service = GraphService(edge_file, cache_size)
+
+    if unix_socket:
+        if os.path.exists(unix_socket):
+            os.remove(unix_socket)
+        server = ThreadingUnixHTTPServer(unix_socket, QueryHandler)
+        print(f" Serving graph queries on unix socket {unix_socket}")
+    else:
+        server = ThreadingHTTPServer((host, port), QueryHandler)
+        print(f" Serving graph queries on http://{host}:{port}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n Server stopped.")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve path/degree/neighbors/stats queries over JSON.")
+    parser.add_argument("--edges", default="data/edges.csv")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--socket", help="listen on this unix socket instead of TCP")
+    parser.add_argument("--cache-size", type=int, default=4096)
+    args = parser.parse_args()
+
+    serve(args.edges, args.host, args.port, args.socket, args.cache_size)
@@ -1,51 +1,95 @@
+import os
+import numpy as np
 import pandas as pd
-import networkx as nx
+from clustering import clustering_summary
+from companies import company_counts, load_company_table
+from graph_store import load_graph_store
 
 def load_graph(edge_file="data/edges.csv"):
-    df = pd.read_csv(edge_file)
-    if "Source" in df.columns and "Target" in df.columns:
-        src, tgt = "Source", "Target"
-    else:
-        src, tgt = df.columns[0], df.columns[1]
-    G = nx.from_pandas_edgelist(df, source=src, target=tgt, create_using=nx.DiGraph())
-    return G, df
+    """
+    Returns a networkx DiGraph view of edges.csv (built on demand from the
+    compact GraphStore, which graph_statistics uses directly).
+    """
+    return load_graph_store(edge_file).to_networkx()
 
 
 def graph_statistics():
     print("\n--- NETWORK STATISTICS ---\n")
 
-    G, edges_df = load_graph()
+    store = load_graph_store()
 
-    num_nodes = G.number_of_nodes()
-    num_edges = G.number_of_edges()
+    num_nodes = store.number_of_nodes()
+    num_edges = store.number_of_edges()
 
     print(f"Total Students (Nodes): {num_nodes}")
     print(f"Total Connections (Edges): {num_edges}")
 
     # Density (how connected the network is)
-    density = nx.density(G)
+    density = store.density()
     print(f"Graph Density: {density:.6f}")
 
-    # Degree statistics
-    degree_df = pd.read_csv("data/degree.csv")
+    # Degree statistics (students = nodes that own a connection list)
+    out_degrees = store.out_degrees()
+    students = np.flatnonzero(out_degrees)
+    degrees = out_degrees[students]
 
-    max_degree = degree_df["Degree"].max()
-    min_degree = degree_df["Degree"].min()
-    avg_degree = degree_df["Degree"].mean()
+    max_degree = int(degrees.max())
+    min_degree = int(degrees.min())
+    avg_degree = float(degrees.mean())
 
-    top_student = degree_df.loc[degree_df["Degree"].idxmax(), "Student"]
-    least_student = degree_df.loc[degree_df["Degree"].idxmin(), "Student"]
+    top_student = store.name(students[degrees.argmax()])
+    least_student = store.name(students[degrees.argmin()])
 
     print(f"\nMost Connected Student: {top_student} ({max_degree}) connections")
     print(f"Least Connected Student: {least_student} ({min_degree}) connections")
     print(f"Average Degree: {avg_degree:.2f}")
 
+    # Connected components (precomputed in the graph snapshot)
+    wcc, scc = store.components()
+    wcc_sizes = np.bincount(wcc)
+    scc_sizes = np.bincount(scc)
+    giant_size = int(wcc_sizes.max()) if len(wcc_sizes) else 0
+    giant_scc_size = int(scc_sizes.max()) if len(scc_sizes) else 0
+
+    print(f"\nWeakly Connected Components: {len(wcc_sizes)}")
+    print(f"Strongly Connected Components: {len(scc_sizes)}")
+    print(f"Giant Component Size: {giant_size} ({giant_size / max(num_nodes, 1):.1%} of nodes)")
+    print(f"Largest Strongly Connected Component: {giant_scc_size}")
+
     # Random walk influence summary
     rw_df = pd.read_csv("data/random_walk_output.csv")
     top_rw = rw_df.sort_values(by="Visits", ascending=False).iloc[0]
 
     print(f"\nTop Influencer (Random Walk): {top_rw['Student']} ({top_rw['Visits']} visits)")
 
+    # Centrality summary (from centrality.compute_centrality)
+    top_central = {}
+    if os.path.exists("data/centrality.csv"):
+        c_df = pd.read_csv("data/centrality.csv")
+        for measure in ["Betweenness", "Closeness", "Eigenvector"]:
+            row = c_df.loc[c_df[measure].idxmax()]
+            top_central[measure] = (row["Student"], row[measure])
+            print(f"Top {measure} Centrality: {row['Student']} ({row[measure]:.6f})")
+
+    # Triangles and clustering (from clustering.build_clustering)
+    triangles = {}
+    if os.path.exists("data/clustering.csv"):
+        triangles = clustering_summary(pd.read_csv("data/clustering.csv", keep_default_na=False))
+        print(f"\nTotal Triangles: {triangles['Total Triangles']}")
+        print(f"Average Clustering Coefficient: {triangles['Average Clustering']:.4f}")
+        print(f"Transitivity: {triangles['Transitivity']:.4f}")
+
+    # Companies (from the materialized company table)
+    companies = {}
+    if os.path.exists("data/company_table.csv"):
+        counts = company_counts(load_company_table("data/company_table.csv"))
+        known = counts[counts.index.notna()]
+        if len(known):
+            companies = {"Distinct Companies": len(known), "Top Company": known.index[0],
+                         "Top Company Connections": int(known.iloc[0])}
+            print(f"\nDistinct Companies: {len(known)}")
+            print(f"Top Company: {known.index[0]} ({int(known.iloc[0])} connections)")
+
     # Save summary
     summary = {
         "Total Nodes": [num_nodes],
@@ -56,9 +100,22 @@ def graph_statistics():
         "Least Connected Student": [least_student],
         "Min Degree": [min_degree],
         "Average Degree": [avg_degree],
+        "Weakly Connected Components": [len(wcc_sizes)],
+        "Strongly Connected Components": [len(scc_sizes)],
+        "Giant Component Size": [giant_size],
+        "Largest SCC Size": [giant_scc_size],
         "Top Influencer": [top_rw["Student"]],
         "Top Influencer Score": [top_rw["Visits"]]
     }
+    for measure, (student, score) in top_central.items():
+        summary[f"Top {measure} Student"] = [student]
+        summary[f"Top {measure} Score"] = [score]
+
+    for key, value in triangles.items():
+        summary[key] = [value]
+
+    for key, value in companies.items():
+        summary[key] = [value]
 
     summary_df = pd.DataFrame(summary)
     summary_df.to_csv("data/network_statistics.csv", index=False)
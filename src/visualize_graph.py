@@ -0,0 +1,370 @@
+import argparse
+import json
+import os
+import shutil
+import numpy as np
+import pandas as pd
+from communities import aggregate, louvain, weighted_graph
+from graph_store import get_graph_store
+
+VIEWER_TEMPLATE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "graph_view.html")
+
+
+# 1. FORCE LAYOUT (Barnes-Hut on a quadtree of grids)
+
+def cell_masses(pos, mass, cells, size):
+    """Total mass and centre of mass of every cell of a size x size grid."""
+    total = np.bincount(cells, weights=mass, minlength=size * size)
+    cx = np.bincount(cells, weights=mass * pos[:, 0], minlength=size * size)
+    cy = np.bincount(cells, weights=mass * pos[:, 1], minlength=size * size)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return total, np.stack([cx / total, cy / total], axis=1)
+
+
+# offsets of the children of a cell's 3 x 3 neighbourhood, relative to 2 * parent
+WINDOW_X = np.repeat(np.arange(-2, 4), 6)
+WINDOW_Y = np.tile(np.arange(-2, 4), 6)
+
+
+def repulsion(pos, mass, levels, softening=0.01):
+    """
+    Repulsive forces (k^2 m_i m_j / d, k = 1) with a Barnes-Hut style
+    approximation: the bounding box is cut into 2^l x 2^l grids for
+    l = 2..levels, and a node feels every cell of level l that is not next
+    to its own cell but whose parent is next to its parent (at most 27
+    cells per level) as one point mass at the cell's centre of mass. At the
+    finest level the neighbouring cells are point masses too (the node's
+    own cell without the node itself). Cost is O(36 n levels) per call,
+    each level as one vectorised pass.
+    """
+    n = len(pos)
+    lo = pos.min(axis=0)
+    span = max(float((pos.max(axis=0) - lo).max()), 1e-9)
+    unit = np.minimum((pos - lo) / span, 1 - 1e-9)
+    x, y = pos[:, 0], pos[:, 1]
+    fx, fy = np.zeros(n), np.zeros(n)
+
+    for level in range(2, levels + 1):
+        size = 1 << level
+        gx = (unit[:, 0] * size).astype(np.int64)
+        gy = (unit[:, 1] * size).astype(np.int64)
+        own = gy * size + gx
+        total, centre = cell_masses(pos, mass, own, size)
+
+        cx = (2 * (gx >> 1))[:, None] + WINDOW_X
+        cy = (2 * (gy >> 1))[:, None] + WINDOW_Y
+        use = (cx >= 0) & (cx < size) & (cy >= 0) & (cy < size)
+        finest = level == levels
+        if not finest:
+            use &= (np.abs(cx - gx[:, None]) > 1) | (np.abs(cy - gy[:, None]) > 1)
+
+        nodes, slot = np.nonzero(use)
+        cells = cy[nodes, slot] * size + cx[nodes, slot]
+        m, px, py = total[cells], centre[cells, 0], centre[cells, 1]
+
+        if finest:
+            # the node's own cell, without the node itself
+            self_cell = np.flatnonzero(cells == own[nodes])
+            i = nodes[self_cell]
+            rest = m[self_cell] - mass[i]
+            with np.errstate(invalid="ignore", divide="ignore"):
+                px[self_cell] = (px[self_cell] * m[self_cell] - x[i] * mass[i]) / rest
+                py[self_cell] = (py[self_cell] * m[self_cell] - y[i] * mass[i]) / rest
+            m[self_cell] = rest
+
+        keep = m > 1e-12
+        nodes, m, px, py = nodes[keep], m[keep], px[keep], py[keep]
+        dx, dy = x[nodes] - px, y[nodes] - py
+        scale = mass[nodes] * m / (dx * dx + dy * dy + softening)
+        fx += np.bincount(nodes, weights=dx * scale, minlength=n)
+        fy += np.bincount(nodes, weights=dy * scale, minlength=n)
+
+    return np.stack([fx, fy], axis=1)
+
+
+def attraction(pos, src, dst, weight):
+    """Spring forces along the (both-direction) edge arrays: w d^2 / k towards each neighbour."""
+    d = pos[dst] - pos[src]
+    pull = weight * np.sqrt(np.einsum("ij,ij->i", d, d))
+    n = len(pos)
+    return np.stack([np.bincount(src, weights=d[:, 0] * pull, minlength=n),
+                     np.bincount(src, weights=d[:, 1] * pull, minlength=n)], axis=1)
+
+
+def force_layout(pos, src, dst, weight, mass, iterations=50, temperature=None, gravity=0.05):
+    """
+    Fruchterman-Reingold iterations with Barnes-Hut repulsion, a weak pull
+    towards the centre (keeps separate components on screen) and a linearly
+    cooling step limit. Ideal edge length is 1. Returns the new positions.
+    """
+    pos = pos.astype(np.float64, copy=True)
+    n = len(pos)
+    if n < 2:
+        return pos
+    levels = int(np.clip(np.ceil(np.log(n / 2) / np.log(4)), 2, 10))  # ~2 nodes per finest cell
+    if temperature is None:
+        temperature = 0.1 * float(np.ptp(pos, axis=0).max())
+
+    for i in range(iterations):
+        force = repulsion(pos, mass, levels) + attraction(pos, src, dst, weight)
+        force -= gravity * mass[:, None] * (pos - pos.mean(axis=0))
+        length = np.sqrt(np.einsum("ij,ij->i", force, force))
+        step = temperature * (1 - i / iterations)
+        pos += force * (np.minimum(length, step) / np.maximum(length, 1e-12))[:, None]
+
+    return pos
+
+
+def multilevel_layout(store, labels, iterations=30, seed=0):
+    """
+    Two-level layout: the community graph (one node per community, mass =
+    size, log-scaled edge weights) is laid out first, every person starts
+    next to their community's position, and the full graph is then refined
+    with a shorter, cooler force run. Returns an (n, 2) array.
+    """
+    rng = np.random.default_rng(seed)
+    n, src, dst, weight = weighted_graph(store)
+    count, csrc, cdst, cweight, labels = aggregate(n, src, dst, weight, labels)
+    sizes = np.bincount(labels, minlength=count).astype(np.float64)
+
+    between = csrc != cdst
+    coarse = rng.normal(size=(count, 2)) * np.sqrt(count)
+    coarse = force_layout(coarse, csrc[between], cdst[between], np.log1p(cweight[between]) / 10, sizes,
+                          iterations=iterations)
+
+    # spread the communities over the area the whole graph needs (~1 per node)
+    spread = max(float(np.ptp(coarse, axis=0).max()), 1e-9)
+    coarse = (coarse - coarse.mean(axis=0)) * (np.sqrt(n) / spread)
+    radius = np.sqrt(sizes / np.pi)
+    pos = coarse[labels] + rng.normal(size=(n, 2)) * radius[labels, None] / 2
+
+    return force_layout(pos, src, dst, weight, np.ones(n), iterations=iterations,
+                        temperature=0.02 * np.sqrt(n))
+
+
+# 2. LEVEL-OF-DETAIL TILES
+
+def tile_of(unit, zoom):
+    """Tile index (ty * 2^zoom + tx) of every point of the unit square at `zoom`."""
+    size = 1 << zoom
+    cells = np.minimum((unit * size).astype(np.int64), size - 1)
+    return cells[:, 1] * size + cells[:, 0]
+
+
+def choose_max_zoom(unit, budget, limit=8):
+    """Smallest zoom whose fullest tile holds at most `budget` nodes (capped at `limit`)."""
+    for zoom in range(limit + 1):
+        if np.bincount(tile_of(unit, zoom)).max() <= budget:
+            return zoom
+    return limit
+
+
+def assign_min_zoom(unit, importance, max_zoom, budget):
+    """
+    First zoom at which every node is drawn individually. At each zoom the
+    most important hidden nodes of a tile are revealed until the tile holds
+    `budget` nodes; everything is revealed at max_zoom. Once drawn, a node
+    stays drawn at every deeper zoom.
+    """
+    n = len(unit)
+    min_zoom = np.full(n, max_zoom, dtype=np.int64)
+
+    for zoom in range(max_zoom):
+        tiles = tile_of(unit, zoom)
+        shown = min_zoom <= zoom
+        room = budget - np.bincount(tiles[shown], minlength=1 << (2 * zoom))
+
+        hidden = np.flatnonzero(~shown)
+        hidden = hidden[np.lexsort((hidden, -importance[hidden], tiles[hidden]))]
+        t = tiles[hidden]
+        rank = np.arange(len(hidden)) - np.searchsorted(t, t)
+        min_zoom[hidden[rank < room[t]]] = zoom
+
+    return min_zoom
+
+
+def write_json(path, payload):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
+
+
+def write_tiles(output_dir, nodes, edges, max_zoom, edge_budget):
+    """
+    Writes tiles/{z}/{x}/{y}.json for every non-empty tile:
+      nodes     [id, name, x, y, degree, community] of the nodes drawn at z
+      clusters  [x, y, count, community]: the hidden nodes of one community
+                in the tile, merged into one point at their centre
+      edges     [a, b, xa, ya, xb, yb] between drawn nodes with an end in
+                the tile, strongest (highest lower degree) first
+    Returns the number of tiles written.
+    """
+    ea, eb = edges
+    written = 0
+
+    for zoom in range(max_zoom + 1):
+        size = 1 << zoom
+        tiles = tile_of(nodes[["X", "Y"]].to_numpy(), zoom)
+        frame = nodes.assign(Tile=tiles)
+        shown = nodes["MinZoom"].to_numpy() <= zoom
+
+        visible = frame[shown].sort_values(by=["Tile", "Degree"], ascending=[True, False], kind="stable")
+        visible_groups = {t: g for t, g in visible.groupby("Tile", sort=False)}
+
+        clusters = (frame[~shown].groupby(["Tile", "Community"])
+                    .agg(X=("X", "mean"), Y=("Y", "mean"), Count=("X", "size")).reset_index())
+        cluster_groups = {t: g for t, g in clusters.groupby("Tile", sort=False)}
+
+        both = shown[ea] & shown[eb]
+        a, b = ea[both], eb[both]
+        strength = np.minimum(nodes["Degree"].to_numpy()[a], nodes["Degree"].to_numpy()[b])
+        edge_rows = pd.DataFrame({
+            "Tile": np.concatenate([tiles[a], tiles[b]]),
+            "A": np.tile(a, 2), "B": np.tile(b, 2), "Strength": np.tile(strength, 2),
+        }).drop_duplicates()
+        edge_rows = (edge_rows.sort_values(by=["Tile", "Strength"], ascending=[True, False], kind="stable")
+                     .groupby("Tile").head(edge_budget))
+        edge_groups = {t: g for t, g in edge_rows.groupby("Tile", sort=False)}
+
+        x, y = nodes["X"].to_numpy(), nodes["Y"].to_numpy()
+        for tile in set(visible_groups) | set(cluster_groups):
+            payload = {"nodes": [], "clusters": [], "edges": []}
+            if tile in visible_groups:
+                g = visible_groups[tile]
+                payload["nodes"] = [[int(i), name, round(float(px), 6), round(float(py), 6), int(deg), int(com)]
+                                    for i, name, px, py, deg, com in
+                                    zip(g.index, g["Name"], g["X"], g["Y"], g["Degree"], g["Community"])]
+            if tile in cluster_groups:
+                g = cluster_groups[tile]
+                payload["clusters"] = [[round(float(px), 6), round(float(py), 6), int(c), int(com)]
+                                       for px, py, c, com in zip(g["X"], g["Y"], g["Count"], g["Community"])]
+            if tile in edge_groups:
+                g = edge_groups[tile]
+                payload["edges"] = [[int(p), int(q), round(float(x[p]), 6), round(float(y[p]), 6),
+                                     round(float(x[q]), 6), round(float(y[q]), 6)]
+                                    for p, q in zip(g["A"], g["B"])]
+
+            write_json(os.path.join(output_dir, "tiles", str(zoom), str(tile % size), f"{tile // size}.json"),
+                       payload)
+            written += 1
+
+    return written
+
+
+def community_overview(nodes, ea, eb, summary_file=None, limit=2000):
+    """
+    The coarsest level: one point per community (centre of its members,
+    size, label) and the strongest links between communities.
+    """
+    groups = nodes.groupby("Community")
+    overview = groups.agg(X=("X", "mean"), Y=("Y", "mean"), Size=("X", "size"))
+    overview["Label"] = nodes.loc[groups["Degree"].idxmax(), "Name"].to_numpy()
+    if summary_file and os.path.exists(summary_file):
+        top = pd.read_csv(summary_file).set_index("Community")["Top Company"]
+        company = overview.index.map(top)
+        overview["Label"] = [f"{label} · {c}" if isinstance(c, str) else label
+                             for label, c in zip(overview["Label"], company)]
+    overview = overview.sort_values(by="Size", ascending=False).head(limit)
+
+    community = nodes["Community"].to_numpy()
+    ca, cb = community[ea], community[eb]
+    links = pd.DataFrame({"A": np.minimum(ca, cb), "B": np.maximum(ca, cb)})
+    links = links[(links["A"] != links["B"]) & links["A"].isin(overview.index) & links["B"].isin(overview.index)]
+    links = links.value_counts().head(limit)
+
+    return {
+        "communities": [[int(c), round(float(r.X), 6), round(float(r.Y), 6), int(r.Size), r.Label]
+                        for c, r in overview.iterrows()],
+        "links": [[int(a), int(b), int(w)] for (a, b), w in links.items()],
+    }
+
+
+# 3. EXPORT
+
+def load_labels(store, communities_file):
+    """
+    Community label per node from communities.csv, or a fresh Louvain run
+    when it is missing or stale. Returns (labels, whether they came from the file).
+    """
+    if communities_file and os.path.exists(communities_file):
+        df = pd.read_csv(communities_file, dtype={"Student": str}, keep_default_na=False)
+        mapping = dict(zip(df["Student"], df["Community"]))
+        names = [store.name(i) for i in range(store.number_of_nodes())]
+        if all(name in mapping for name in names):
+            return np.array([mapping[name] for name in names], dtype=np.int64), True
+        print(f" {communities_file} does not match the graph, running Louvain")
+    labels, _ = louvain(store)
+    return labels, False
+
+
+def export_interactive(edge_file="data/edges.csv", communities_file="data/communities.csv",
+                       summary_file="data/community_summary.csv", output_dir="data/graph_view",
+                       budget=400, edge_budget=1500, max_zoom=8, iterations=30, seed=0):
+    """
+    Interactive HTML view of the whole network that stays responsive for
+    100k+ nodes: the layout is computed here (multilevel, Barnes-Hut), and
+    the browser only ever loads the community overview plus the JSON tiles
+    of the area on screen, each holding at most `budget` individual nodes
+    (the rest merged into per-community clusters) and `edge_budget` edges.
+
+    output_dir gets index.html, index.json (overview and metadata),
+    names.json (for search, loaded on first use) and tiles/{z}/{x}/{y}.json.
+    Serve it over HTTP (python -m http.server -d data/graph_view); browsers
+    block fetch() from file:// pages.
+    """
+    store = get_graph_store(edge_file)
+    n = store.number_of_nodes()
+    labels, from_file = load_labels(store, communities_file)
+    if not from_file:
+        summary_file = None  # its community numbers belong to another run
+
+    pos = multilevel_layout(store, labels, iterations, seed)
+    lo = pos.min(axis=0)
+    span = max(float(np.ptp(pos, axis=0).max()), 1e-9)
+    unit = 0.02 + 0.96 * (pos - lo) / span  # small margin inside the unit square
+
+    offsets, neighbors = store.symmetric()
+    degrees = np.diff(offsets)
+    src = np.repeat(np.arange(n), degrees)
+    dst = np.asarray(neighbors, dtype=np.int64)
+    ea, eb = src[src < dst], dst[src < dst]
+
+    max_zoom = choose_max_zoom(unit, budget, max_zoom)
+    importance = degrees + np.arange(n)[::-1] / max(n, 1)  # degree, then ID
+    min_zoom = assign_min_zoom(unit, importance, max_zoom, budget)
+
+    nodes = pd.DataFrame({
+        "Name": [store.name(i) for i in range(n)],
+        "X": unit[:, 0], "Y": unit[:, 1],
+        "Degree": degrees, "Community": labels, "MinZoom": min_zoom,
+    })
+
+    if os.path.exists(os.path.join(output_dir, "tiles")):
+        shutil.rmtree(os.path.join(output_dir, "tiles"))
+    tiles = write_tiles(output_dir, nodes, (ea, eb), max_zoom, edge_budget)
+
+    index = {"nodes": n, "edges": len(ea), "max_zoom": max_zoom, "budget": budget}
+    index.update(community_overview(nodes, ea, eb, summary_file))
+    write_json(os.path.join(output_dir, "index.json"), index)
+
+    order = nodes.sort_values(by="Degree", ascending=False, kind="stable")
+    write_json(os.path.join(output_dir, "names.json"),
+               [[name, round(float(x), 6), round(float(y), 6), int(z)]
+                for name, x, y, z in zip(order["Name"], order["X"], order["Y"], order["MinZoom"])])
+    shutil.copyfile(VIEWER_TEMPLATE, os.path.join(output_dir, "index.html"))
+
+    print(f" Layout of {n} nodes, {tiles} tiles over zoom 0-{max_zoom}")
+    print(f" Interactive graph saved → {os.path.join(output_dir, 'index.html')} "
+          f"(serve with: python -m http.server -d {output_dir})")
+    return nodes
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Interactive HTML export of the whole network.")
+    parser.add_argument("--edges", default="data/edges.csv")
+    parser.add_argument("--output", default="data/graph_view")
+    parser.add_argument("--budget", type=int, default=400, help="individual nodes per tile")
+    parser.add_argument("--iterations", type=int, default=30)
+    args = parser.parse_args()
+
+    export_interactive(args.edges, output_dir=args.output, budget=args.budget, iterations=args.iterations)
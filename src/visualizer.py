@@ -1,6 +1,9 @@
 import os
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
+from companies import company_counts, load_company_table
+from industries import IndustryClassifier
 
 
 # 1. DEGREE DISTRIBUTION
@@ -42,20 +45,27 @@ def plot_top_students(degree_file="data/degree.csv", top_n=10):
 
 # 3. TOP COMPANIES (Count in network)
 
-def plot_top_companies(cleaned_folder="data/cleaned"):
-    companies = []
+def load_company_counts(cleaned_folder="data/cleaned", table_file="data/company_table.csv", dataset=None,
+                        student=None, top_n=None):
+    """
+    Returns a Series of row counts per company (missing companies under NaN),
+    read from the materialized company table; `student` and `top_n` filter
+    it without rescanning the connection files.
+    """
+    table = load_company_table(table_file, cleaned_folder, dataset)
+    return company_counts(table, student, top_n)
 
-    for file in os.listdir(cleaned_folder):
-        if file.endswith(".csv"):
-            df = pd.read_csv(os.path.join(cleaned_folder, file))
-            companies.extend(df["Company"].dropna().tolist())
 
-    comp_df = pd.DataFrame(companies, columns=["Company"])
-    top = comp_df["Company"].value_counts().head(20)
+def plot_top_companies(cleaned_folder="data/cleaned", table_file="data/company_table.csv", dataset=None,
+                       top_n=20, student=None):
+    top = load_company_counts(cleaned_folder, table_file, dataset, student, top_n)
+    title = f"Top {top_n} Most Common Companies in Connections"
+    if student:
+        title += f" of {student}"
 
     plt.figure(figsize=(12,6))
     plt.barh(top.index, top.values, color="#0984E3")
-    plt.title("Top 20 Most Common Companies in Connections")
+    plt.title(title)
     plt.xlabel("Frequency")
     plt.tight_layout()
     plt.savefig("data/top_companies.png")
@@ -67,42 +77,18 @@ def plot_top_companies(cleaned_folder="data/cleaned"):
 
 # 4. INDUSTRY DISTRIBUTION GRAPH
 
-def plot_industry_distribution(cleaned_folder="data/cleaned"):
-    industries = {
-        "Tech": 0,
-        "Finance": 0,
-        "Education": 0,
-        "Engineering": 0,
-        "Other": 0
-    }
-
-    keywords = {
-        "Tech": ["tech", "software", "it", "digital", "ai"],
-        "Finance": ["bank", "finance", "capital", "money"],
-        "Education": ["university", "school", "college", "institute"],
-        "Engineering": ["engineer", "engineering", "mechanical", "electrical"]
-    }
-
-    for file in os.listdir(cleaned_folder):
-        if file.endswith(".csv"):
-            df = pd.read_csv(os.path.join(cleaned_folder, file))
-
-            for comp in df["Company"].fillna("None"):
-                cl = comp.lower()
-                found = False
-
-                for category, words in keywords.items():
-                    if any(w in cl for w in words):
-                        industries[category] += 1
-                        found = True
-                        break
-
-                if not found:
-                    industries["Other"] += 1
+def plot_industry_distribution(cleaned_folder="data/cleaned", table_file="data/company_table.csv", dataset=None,
+                               taxonomy_file="config/industries.json", cache_file="data/industry_cache.json",
+                               student=None):
+    counts = load_company_counts(cleaned_folder, table_file, dataset, student)
+
+    # each distinct company is classified once (and cached across runs)
+    classifier = IndustryClassifier(taxonomy_file, cache_file)
+    industries = classifier.industry_counts(counts)
 
     # Plotting the bar graph
     plt.figure(figsize=(10,6))
-    plt.bar(industries.keys(), industries.values(), color="#6C5CE7")
+    plt.bar(industries.index, industries.values, color="#6C5CE7")
     plt.title("Industry Distribution of Connections")
     plt.ylabel("Count of People")
     plt.tight_layout()
@@ -113,7 +99,47 @@ def plot_industry_distribution(cleaned_folder="data/cleaned"):
 
 
 
-# 5. RUN ALL VISUALIZATIONS
+# 5. HOP-PLOT AND EXTENDED-NETWORK REACH
+
+def plot_hop_plot(hop_plot_file="data/hop_plot.csv"):
+    df = pd.read_csv(hop_plot_file)
+
+    plt.figure(figsize=(10, 5))
+    plt.plot(df["Hops"], df["Fraction"], marker="o", color="#E17055")
+    plt.axhline(0.9, linestyle="--", color="grey", linewidth=1)
+    plt.title("Hop-Plot: Share of Reachable Pairs Within h Hops")
+    plt.xlabel("Hops")
+    plt.ylabel("Fraction of Reachable Pairs")
+    plt.xticks(df["Hops"])
+    plt.tight_layout()
+    plt.savefig("data/hop_plot.png")
+    plt.close()
+
+    print(" Saved --> data/hop_plot.png")
+
+
+def plot_reach_distribution(reach_file="data/neighborhood.csv"):
+    df = pd.read_csv(reach_file)
+    columns = [c for c in df.columns if c.startswith("Reach ")]
+
+    bins = 40 if df.empty else np.linspace(0, df[columns].to_numpy().max(), 41)
+
+    plt.figure(figsize=(10, 5))
+    for column in columns:
+        plt.hist(df[column], bins=bins, histtype="step", linewidth=2, label=f"{column.split()[1]} hops")
+    plt.title("Extended Network Size of Students")
+    plt.xlabel("People Reachable (approximate)")
+    plt.ylabel("Count of Students")
+    plt.legend()
+    plt.tight_layout()
+    plt.savefig("data/reach_distribution.png")
+    plt.close()
+
+    print(" Saved --> data/reach_distribution.png")
+
+
+
+# 6. RUN ALL VISUALIZATIONS
 
 def generate_all_plots():
     print("\n Generating visualizations...\n")
@@ -123,6 +149,11 @@ def generate_all_plots():
     plot_top_companies()
     plot_industry_distribution()
 
+    if os.path.exists("data/hop_plot.csv"):
+        plot_hop_plot()
+    if os.path.exists("data/neighborhood.csv"):
+        plot_reach_distribution()
+
     print("\n All visualizations completed! Files saved inside /data/ folder.\n")
 
 if __name__ == "__main__":
@@ -0,0 +1,44 @@
+import os
+import sys
+import numpy as np
+import pandas as pd
+import pytest
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+sys.path.insert(0, SRC)
+
+
+def fixture_edges():
+    """
+    A fixed directed graph: 40 students with seeded random connection lists
+    over 120 people, a 3-cycle and a 2-cycle between students, and one
+    separate component, so paths, SCCs and WCCs are all non-trivial.
+    """
+    rng = np.random.default_rng(7)
+    people = [f"Person {i:03d}" for i in range(120)]
+    students = [f"Student {i:02d}" for i in range(40)]
+    edges = set()
+    for i, student in enumerate(students):
+        for j in rng.choice(len(people), size=int(rng.integers(2, 9)), replace=False):
+            edges.add((student, people[j]))
+        if i % 5 == 0:
+            edges.add((student, students[(i + 7) % len(students)]))
+    edges |= {("Student 01", "Student 02"), ("Student 02", "Student 03"), ("Student 03", "Student 01"),
+              ("Student 10", "Student 11"), ("Student 11", "Student 10"),
+              ("Island A", "Island B"), ("Island B", "Island C")}
+    return sorted(edges)
+
+
+@pytest.fixture
+def edge_file(tmp_path):
+    path = tmp_path / "edges.csv"
+    pd.DataFrame(fixture_edges(), columns=["Source", "Target"]).to_csv(path, index=False, encoding="utf-8-sig")
+    return str(path)
+
+
+@pytest.fixture
+def nx_graph():
+    nx = pytest.importorskip("networkx")
+    G = nx.DiGraph()
+    G.add_edges_from(fixture_edges())
+    return G
@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+from edge_stream import EdgeSpiller
+from graph_builder import build_graph
+from graph_store import load_snapshot
+
+
+def write_adjacency(folder):
+    """
+    Fixed adjacency files: 30 students with overlapping connection lists, and
+    every tenth student exported twice, so the dedupe has real work to do.
+    """
+    rng = np.random.default_rng(11)
+    folder.mkdir()
+    for i in range(30):
+        connections = [f"Person {j:03d}" for j in rng.choice(400, size=80, replace=False)]
+        exports = ["0000aaaa", "0000bbbb"] if i % 10 == 0 else ["0000aaaa"]
+        for file_id in exports:
+            pd.DataFrame({"connected_to": connections}).to_csv(
+                folder / f"Student_{i:02d}--{file_id}.csv", index=False)
+
+
+def edge_set(edge_file):
+    df = pd.read_csv(edge_file, dtype=str, keep_default_na=False, encoding="utf-8-sig")
+    assert not df.duplicated().any()
+    return set(zip(df["Source"], df["Target"]))
+
+
+def test_streaming_build_matches_in_memory(tmp_path):
+    write_adjacency(tmp_path / "adjacency")
+    build_graph(str(tmp_path / "adjacency"), str(tmp_path / "memory.csv"))
+    # a 0.05 MB cap makes the spiller flush its buffer more than once
+    build_graph(str(tmp_path / "adjacency"), str(tmp_path / "stream.csv"), memory_limit_mb=0.05)
+
+    assert edge_set(tmp_path / "stream.csv") == edge_set(tmp_path / "memory.csv")
+    assert len(edge_set(tmp_path / "memory.csv")) == 30 * 80
+
+    memory = load_snapshot(str(tmp_path / "graph_snapshot" / "memory"))
+    stream = load_snapshot(str(tmp_path / "graph_snapshot" / "stream"))
+    assert memory.number_of_nodes() == stream.number_of_nodes()
+    assert memory.number_of_edges() == stream.number_of_edges()
+    for node in range(memory.number_of_nodes()):
+        name = memory.name(node)
+        out_names = {memory.name(n) for n in memory.successors(node)}
+        assert out_names == {stream.name(n) for n in stream.successors(stream.node_id(name))}
+
+
+def test_spiller_dedupes_across_partitions(tmp_path):
+    # 0.01 MB over 4 partitions: every partition is too big and gets split again
+    spiller = EdgeSpiller(str(tmp_path / "spill"), memory_limit_mb=0.01, partitions=4)
+    edges = [(f"S{i % 7}", f"T{i % 500}") for i in range(5000)]
+    for start in range(0, len(edges), 700):
+        spiller.add(edges[start:start + 700])
+
+    total = spiller.write_deduped(str(tmp_path / "edges.csv"))
+
+    assert total == len(set(edges))
+    assert edge_set(tmp_path / "edges.csv") == set(edges)
+    assert spiller.names == {s for s, _ in edges} | {t for _, t in edges}
@@ -0,0 +1,98 @@
+import os
+import networkx as nx
+import numpy as np
+import pandas as pd
+import pytest
+from clustering import count_triangles
+from graph_store import GraphStore, NodeNotFound, load_graph_store, load_snapshot, write_snapshot
+
+
+def partition(labels, store):
+    groups = {}
+    for node, label in enumerate(np.asarray(labels).tolist()):
+        groups.setdefault(label, set()).add(store.name(node))
+    return sorted(map(sorted, groups.values()))
+
+
+@pytest.mark.parametrize("undirected", [False, True])
+def test_search_matches_networkx(edge_file, nx_graph, undirected):
+    store = load_graph_store(edge_file)
+    G = nx_graph.to_undirected() if undirected else nx_graph
+    names = sorted(G.nodes)
+
+    for source in names[::7]:
+        lengths = nx.single_source_shortest_path_length(G, source)
+        for target in names[::5]:
+            path = store.search(source, target, undirected=undirected).path
+            if target not in lengths:
+                assert path is None
+                continue
+            assert len(path) - 1 == lengths[target]
+            assert path[0] == source and path[-1] == target
+            assert all(G.has_edge(a, b) for a, b in zip(path, path[1:]))
+
+
+def test_bfs_tree_matches_networkx(edge_file, nx_graph):
+    store = load_graph_store(edge_file)
+    source = "Student 00"
+    parent, dist = store.bfs(store.node_id(source))
+    lengths = nx.single_source_shortest_path_length(nx_graph, source)
+
+    for node in range(store.number_of_nodes()):
+        name = store.name(node)
+        assert dist[node] == lengths.get(name, -1)
+        if name in lengths:
+            assert len(store.tree_path(parent, node)) - 1 == lengths[name]
+
+
+def test_components_match_networkx(edge_file, nx_graph):
+    store = load_graph_store(edge_file)
+    wcc, scc = store.components()
+
+    assert partition(wcc, store) == sorted(map(sorted, nx.weakly_connected_components(nx_graph)))
+    assert partition(scc, store) == sorted(map(sorted, nx.strongly_connected_components(nx_graph)))
+
+
+def test_unknown_node(edge_file):
+    store = load_graph_store(edge_file)
+    with pytest.raises(NodeNotFound):
+        store.node_id("Nobody")
+
+
+def test_edge_chunks_build_the_same_store(edge_file):
+    df = pd.read_csv(edge_file, dtype=str, keep_default_na=False)
+    expected = GraphStore.from_edges(df["Source"], df["Target"])
+    names = set(df["Source"]) | set(df["Target"])
+    chunks = ((df["Source"].to_numpy()[start:start + 100], df["Target"].to_numpy()[start:start + 100])
+              for start in range(0, len(df), 100))
+    store = GraphStore.from_edge_chunks(names, chunks, len(df))
+
+    for key in ["offsets", "neighbors", "rev_offsets", "rev_neighbors"]:
+        assert np.array_equal(getattr(store, key), getattr(expected, key))
+    assert [store.name(i) for i in range(store.number_of_nodes())] == list(expected.names)
+
+
+def test_snapshot_rewrite_keeps_mapped_arrays_valid(edge_file, tmp_path):
+    snapshot_dir = str(tmp_path / "snapshot")
+    store = load_graph_store(edge_file, snapshot_dir)
+    mapped = load_snapshot(snapshot_dir)
+    before = np.array(mapped.neighbors)
+
+    write_snapshot(store, snapshot_dir, edge_file)
+    write_snapshot(store, snapshot_dir, edge_file)
+
+    # the old generation is still readable, and the new one is what loads
+    assert np.array_equal(mapped.neighbors, before)
+    assert np.array_equal(load_snapshot(snapshot_dir).neighbors, before)
+    assert not [f for f in os.listdir(snapshot_dir) if f.endswith(".npy")]
+
+
+def test_triangles_match_networkx(edge_file, nx_graph):
+    triangles, degrees = count_triangles(edge_file)
+    store = load_graph_store(edge_file)
+    G = nx_graph.to_undirected()
+    expected = nx.triangles(G)
+
+    for node in range(store.number_of_nodes()):
+        assert triangles[node] == expected[store.name(node)]
+        assert degrees[node] == G.degree(store.name(node))
@@ -0,0 +1,92 @@
+import os
+import pandas as pd
+from manifest import update_pipeline
+
+COMPANIES = ["Acme", "Globex", "Initech", None]
+
+
+def write_raw(raw_dir, name, people):
+    rows = [{"First Name": "Person", "Last Name": f"{p:03d}", "Company": COMPANIES[p % len(COMPANIES)]}
+            for p in people]
+    pd.DataFrame(rows).to_csv(raw_dir / f"{name}.csv", index=False)
+
+
+def run(root, full=False):
+    """Runs the pipeline on root/raw with every output under root."""
+    update_pipeline(str(root / "raw"),
+                    cleaned_folder=str(root / "cleaned"),
+                    adjacency_folder=str(root / "adjacency"),
+                    degree_output=str(root / "degree.csv"),
+                    connections_output=str(root / "connected_to"),
+                    edges_output=str(root / "edges.csv"),
+                    companies_output=str(root / "company_table.csv"),
+                    manifest_path=str(root / "manifest.json"),
+                    full=full)
+
+
+def outputs(root):
+    """Everything the pipeline produced, in an order-independent form."""
+    def table(name):
+        df = pd.read_csv(root / name, dtype=str, keep_default_na=False, encoding="utf-8-sig")
+        return sorted(df.itertuples(index=False, name=None))
+
+    return {
+        "degree": table("degree.csv"),
+        "edges": table("edges.csv"),
+        "companies": table("company_table.csv"),
+        "files": {d: sorted(os.listdir(root / d)) for d in ["cleaned", "adjacency", "connected_to"]},
+    }
+
+
+def first_version(raw_dir):
+    raw_dir.mkdir(parents=True)
+    write_raw(raw_dir, "Aman Singh", range(0, 40))
+    write_raw(raw_dir, "Priya Rao Connections", range(20, 70))
+    write_raw(raw_dir, "Ravi Kumar", range(50, 60))
+
+
+def second_version(raw_dir):
+    write_raw(raw_dir, "Aman Singh", range(5, 45))
+    os.remove(raw_dir / "Ravi Kumar.csv")
+    write_raw(raw_dir, "Neha Shah", range(100, 130))
+
+
+def test_incremental_run_matches_full_rebuild(tmp_path):
+    incremental, fresh = tmp_path / "incremental", tmp_path / "fresh"
+
+    first_version(incremental / "raw")
+    run(incremental)
+    second_version(incremental / "raw")
+    run(incremental)
+
+    first_version(fresh / "raw")
+    second_version(fresh / "raw")
+    run(fresh)
+
+    assert outputs(incremental) == outputs(fresh)
+    assert not any("Ravi" in f for files in outputs(incremental)["files"].values() for f in files)
+
+
+def test_unchanged_run_keeps_outputs(tmp_path):
+    first_version(tmp_path / "raw")
+    run(tmp_path)
+    before = outputs(tmp_path)
+    mtime = os.stat(tmp_path / "edges.csv").st_mtime_ns
+
+    run(tmp_path)
+
+    assert outputs(tmp_path) == before
+    assert os.stat(tmp_path / "edges.csv").st_mtime_ns == mtime
+
+
+def test_full_run_removes_outputs_of_vanished_files(tmp_path):
+    first_version(tmp_path / "raw")
+    run(tmp_path)
+    os.remove(tmp_path / "raw" / "Ravi Kumar.csv")
+
+    run(tmp_path, full=True)
+
+    result = outputs(tmp_path)
+    assert not any("Ravi" in f for files in result["files"].values() for f in files)
+    assert "Ravi Kumar" not in {row[0] for row in result["degree"]}
+    assert "Ravi Kumar" not in {row[0] for row in result["edges"]}
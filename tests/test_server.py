@@ -0,0 +1,106 @@
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+from http.server import ThreadingHTTPServer
+import pandas as pd
+import pytest
+from server import GraphService, QueryHandler
+
+
+@pytest.fixture
+def service(edge_file):
+    return GraphService(edge_file, check_interval=3600)
+
+
+@pytest.fixture
+def url(service):
+    QueryHandler.service = service
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), QueryHandler)
+    threading.Thread(target=httpd.serve_forever, args=(0.05,), daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def request(url, body=None):
+    """(status, JSON payload) of a GET, or of a POST when body (raw bytes) is given."""
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, data=body), timeout=10) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def test_path_query(url):
+    status, payload = request(f"{url}/path?source=Student%2001&target=Student%2003")
+    assert status == 200
+    assert payload["path"] == ["Student 01", "Student 02", "Student 03"]
+    assert payload["distance"] == 2
+
+
+def test_post_query(url):
+    status, payload = request(f"{url}/degree", json.dumps({"name": "Island B"}).encode())
+    assert status == 200
+    assert (payload["out_degree"], payload["in_degree"]) == (1, 1)
+
+
+def test_unknown_name_is_404_with_suggestions(url):
+    status, payload = request(f"{url}/degree?name=Island%20Z")
+    assert status == 404
+    assert sorted(payload["suggestions"]) == ["Island A", "Island B", "Island C"]
+
+
+@pytest.mark.parametrize("query", ["path?source=Student%2001", "degree", "neighbors?limit=3"])
+def test_missing_parameter_is_400(url, query):
+    status, payload = request(f"{url}/{query}")
+    assert status == 400
+    assert payload["error"].startswith("Missing parameter")
+
+
+@pytest.mark.parametrize("body", [b"[1, 2]", b'"x"', b"3", b"null", b"{not json"])
+def test_non_object_body_is_400(url, body):
+    status, payload = request(f"{url}/degree", body)
+    assert status == 400
+    assert payload == {"error": "Body must be a JSON object"}
+
+
+def test_bad_direction_is_400(url):
+    status, payload = request(f"{url}/neighbors?name=Island%20B&direction=sideways")
+    assert status == 400
+    assert "direction" in payload["error"]
+
+
+def test_unknown_query_is_400(url):
+    status, payload = request(f"{url}/shortest")
+    assert status == 400
+    assert payload["error"] == "Unknown query: shortest"
+
+
+def test_handler_failure_is_500(url, service, monkeypatch):
+    def broken(state, params):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(service, "degree", broken)
+    status, payload = request(f"{url}/degree?name=Island%20B")
+    assert status == 500
+    assert payload == {"error": "Internal server error"}
+    # the server keeps answering afterwards
+    assert request(f"{url}/stats")[0] == 200
+
+
+def test_reload_runs_in_the_background(service, edge_file):
+    old = service.current_state()
+    pd.DataFrame([("Island A", "Island D")], columns=["Source", "Target"]).to_csv(
+        edge_file, index=False, encoding="utf-8-sig")
+    service.check_interval = 0
+    service.checked_at = 0.0
+
+    # the request that triggers the reload is answered from the old state
+    assert service.current_state() is old
+
+    deadline = time.time() + 10
+    while service.current_state() is old and time.time() < deadline:
+        time.sleep(0.01)
+    assert service.query("stats", {})["nodes"] == 2